@@ -6,8 +6,10 @@
 
 from dataclasses import dataclass, field
 from datetime import date
+from functools import partial
 from glob import glob
 from logging import getLogger
+from multiprocessing import Pool
 from os import PathLike, cpu_count
 from pathlib import Path
 from typing import Any, Callable, Final, Iterable, Iterator, Literal, Sequence
@@ -36,7 +38,7 @@ from .utils.data import (
     RunOptions,
     VariableOptions,
 )
-from .utils.gdal_formats import TIF_EXTENSION_STR
+from .utils.gdal_formats import TIF_EXTENSION_STR, ZARR_EXTENSION_STR
 from .utils.xarray import (
     BRITISH_NATIONAL_GRID_EPSG,
     NETCDF_EXTENSION_STR,
@@ -47,6 +49,7 @@ from .utils.xarray import (
     get_cpm_for_coord_alignment,
     hads_resample_and_reproject,
     region_crop_file_name,
+    zarr_chunk_encoding,
 )
 
 logger = getLogger(__name__)
@@ -85,6 +88,22 @@ def reproject_2_2km_filename(path: Path) -> Path:
     return path.parent / path.name.replace("_1km", "_2_2km")
 
 
+# `ResamblerBase` method set per `multiprocessing` worker by `_range_call`
+_range_call_worker_method: Callable | None = None
+
+
+def _set_range_call_worker_method(method: Callable) -> None:
+    """Store `method` for `_range_call_worker` calls in a `Pool` worker."""
+    global _range_call_worker_method
+    _range_call_worker_method = method
+
+
+def _range_call_worker(index: int, **kwargs) -> Path | T_Dataset:
+    """Call the worker's `_range_call_worker_method` for `index`."""
+    assert _range_call_worker_method is not None
+    return _range_call_worker_method(index=index, **kwargs)
+
+
 @dataclass(kw_only=True)
 class ResamblerBase:
     """Base class to inherit for `HADs` and `CPM`."""
@@ -96,6 +115,7 @@ class ResamblerBase:
     cpus: int | None = None
     crop_region: RegionOptions | str | None = RegionOptions.GLASGOW
     crop_path: PathLike = RESAMPLING_OUTPUT_PATH
+    crop_to_zarr: bool = False
     final_crs: str = BRITISH_NATIONAL_GRID_EPSG
     input_file_extension: NETCDF_OR_TIF = NETCDF_EXTENSION_STR
     export_file_extension: NETCDF_OR_TIF = NETCDF_EXTENSION_STR
@@ -201,10 +221,31 @@ class ResamblerBase:
         step: int,
         override_export_path: Path | None = None,
         source_to_index: Iterable | None = None,
+        multiprocess: bool = False,
+        cpus: int | None = None,
     ) -> list[Path | T_Dataset]:
         export_paths: list[Path | T_Dataset] = []
         if stop is None:
             stop = len(self)
+        if multiprocess:
+            cpus = cpus or self.cpus
+            if self.total_cpus and cpus:
+                cpus = max(1, min(cpus, self.total_cpus - 1))
+            # Resolve shared state once here rather than in every worker
+            self._prepare_range_call()
+            # Each index is independent, so `Pool.map` keeps `index` order
+            index_call: Callable = partial(
+                _range_call_worker,
+                override_export_path=override_export_path,
+                source_to_index=source_to_index,
+            )
+            # Send `method` (and so `self`) once per worker, not per `index`
+            with Pool(
+                processes=cpus,
+                initializer=_set_range_call_worker_method,
+                initargs=(method,),
+            ) as pool:
+                return pool.map(index_call, range(start, stop, step))
         for index in trange(start, stop, step):
             export_paths.append(
                 method(
@@ -215,6 +256,9 @@ class ResamblerBase:
             )
         return export_paths
 
+    def _prepare_range_call(self) -> None:
+        """Set any state shared by all `index` calls before a `Pool` starts."""
+
     def range_to_reprojection(
         self,
         start: int | None = None,
@@ -222,6 +266,8 @@ class ResamblerBase:
         step: int = 1,
         override_export_path: Path | None = None,
         source_to_index: Sequence | None = None,
+        multiprocess: bool = False,
+        cpus: int | None = None,
     ) -> list[Path]:
         start = start or self.start_index
         stop = stop or self.stop_index
@@ -232,6 +278,8 @@ class ResamblerBase:
             step=step,
             override_export_path=override_export_path,
             source_to_index=source_to_index,
+            multiprocess=multiprocess,
+            cpus=cpus,
         )
 
     def execute(self, skip_spatial: bool = False, **kwargs) -> list[Path] | None:
@@ -327,7 +375,16 @@ class ResamblerBase:
             self.crop_region, resampled_xr.name
         )
         export_path: Path = path / cropped_file_name
-        cropped.to_netcdf(export_path)
+        if self.crop_to_zarr:
+            export_path = export_path.with_suffix("." + ZARR_EXTENSION_STR)
+            cropped.to_zarr(
+                export_path,
+                mode="w",
+                consolidated=True,
+                encoding=zarr_chunk_encoding(cropped),
+            )
+        else:
+            cropped.to_netcdf(export_path)
         if not hasattr(self, "_cropped_paths"):
             self._cropped_paths: list[PathLike] = []
         self._cropped_paths.append(export_path)
@@ -353,6 +410,9 @@ class HADsResampler(ResamblerBase):
         Function to call on `self.input_files`.
     crop
         Path or file to spatially crop `input_files` with.
+    crop_to_zarr
+        Whether to save crops as consolidated `zarr` stores rather than
+        `NetCDF`. Requires `zarr` to be installed.
     final_crs
         Coordinate Reference System (CRS) to return final format in.
     input_file_x_column_name
@@ -418,6 +478,12 @@ class HADsResampler(ResamblerBase):
             self.cpm_for_coord_alignment,
             skip_reproject=self.cpm_for_coord_alignment_path_converted,
         )
+        # Later calls (e.g. per `index`) reuse the aligned `Dataset` as is
+        self.cpm_for_coord_alignment_path_converted = True
+
+    def _prepare_range_call(self) -> None:
+        """Align `cpm_for_coord_alignment` once before `index` workers start."""
+        self.set_cpm_for_coord_alignment()
 
     def to_reprojection(
         self,
@@ -468,6 +534,9 @@ class CPMResampler(ResamblerBase):
         Function to call on `self.input_files`.
     crop
         Path or file to spatially crop `input_files` with.
+    crop_to_zarr
+        Whether to save crops as consolidated `zarr` stores rather than
+        `NetCDF`. Requires `zarr` to be installed.
     final_crs
         Coordinate Reference System (CRS) to return final format in.
     input_file_x_column_name
@@ -813,7 +882,8 @@ class ResamblerManagerBase:
         if multiprocess:
             cpus = cpus or self.cpus
             if self.total_cpus and cpus:
-                cpus = min(cpus, self.total_cpus - 1)
+                # No more workers than configs to run
+                cpus = max(1, min(cpus, self.total_cpus - 1, len(resamplers)))
             results = multiprocess_execute(resamplers, method_name="execute", cpus=cpus)
         else:
             for resampler in resamplers:
@@ -838,7 +908,8 @@ class ResamblerManagerBase:
         if multiprocess:
             cpus = cpus or self.cpus
             if self.total_cpus and cpus:
-                cpus = min(cpus, self.total_cpus - 1)
+                # No more workers than configs to run
+                cpus = max(1, min(cpus, self.total_cpus - 1, len(croppers)))
             results = multiprocess_execute(
                 croppers, method_name="execute_crops", cpus=cpus
             )
@@ -952,6 +1023,8 @@ class HADsResamplerManager(ResamblerManagerBase):
             self.cpm_for_coord_alignment,
             skip_reproject=self.cpm_for_coord_alignment_path_converted,
         )
+        # `yield_configs` then passes the aligned `Dataset` to every config
+        self.cpm_for_coord_alignment_path_converted = True
 
     def yield_configs(self) -> Iterable[HADsResampler]:
         """Generate a `CPMResampler` or `HADsResampler` for `self.input_paths`."""
@@ -25,6 +25,8 @@ from typing import (
     Union,
 )
 
+import numpy as np
+from numpy.typing import NDArray
 from rich.console import Console
 from tqdm import TqdmExperimentalWarning, tqdm
 
@@ -439,6 +441,83 @@ def date_range_generator(
         yield (date_obj if yield_type == date else date_obj.strftime(output_format_str))
 
 
+def date_range_array(
+    start_date: DateType,
+    end_date: DateType,
+    inclusive: bool = False,
+    skip_dates: Iterable[DateType] | DateType | None = None,
+    start_format_str: str = CLI_DATE_FORMAT_STR,
+    end_format_str: str = CLI_DATE_FORMAT_STR,
+    skip_dates_format_str: str = CLI_DATE_FORMAT_STR,
+) -> NDArray:
+    """Return a `datetime64[D]` array of days, vectorised `date_range_generator`.
+
+    Parameters
+    ----------
+    start_date
+        `DateType` at start of time series.
+    end_date
+        `DateType` at end of time series.
+    inclusive
+        Whether to include the `end_date` in the returned time series.
+    skip_dates
+        Dates to skip between `start_date` and `end_date`.
+    start_format_str
+        A `strftime` format to apply if `start_date` `type` is `str`.
+    end_format_str
+        A `strftime` format to apply if `end_date` `type` is `str`.
+    skip_dates_format_str
+        A `strftime` format to apply if any `skip_dates` are `str`.
+
+    Returns
+    -------
+    :
+        A `numpy` `datetime64[D]` array of each day in range.
+
+    Examples
+    --------
+    >>> four_years: NDArray = date_range_array('19801130', '19841130')
+    >>> len(four_years)
+    1461
+    >>> four_years[[0, -1]]
+    array(['1980-11-30', '1984-11-29'], dtype='datetime64[D]')
+    >>> len(date_range_array('19801130', '19841130', inclusive=True))
+    1462
+    >>> len(date_range_array('19801130', '19841130',
+    ...                      inclusive=True, skip_dates='19840229'))
+    1461
+    >>> np.array_equal(
+    ...     date_range_array('19801130', '19841130', skip_dates='19840229'),
+    ...     tuple(date_range_generator('19801130', '19841130',
+    ...                                skip_dates='19840229')))
+    True
+    """
+    start_date = ensure_date(start_date, start_format_str)
+    end_date = ensure_date(end_date, end_format_str)
+    if inclusive:
+        end_date += timedelta(days=1)
+    try:
+        assert start_date < end_date
+    except AssertionError:
+        raise ValueError(
+            f"start_date: {start_date} must be before end_date: {end_date}"
+        )
+    dates: NDArray = np.arange(
+        np.datetime64(start_date, "D"),
+        np.datetime64(end_date, "D"),
+        dtype="datetime64[D]",
+    )
+    if skip_dates:
+        if isinstance(skip_dates, str | date):
+            skip_dates = [skip_dates]
+        skip_array: NDArray = np.array(
+            [ensure_date(skip_date, skip_dates_format_str) for skip_date in skip_dates],
+            dtype="datetime64[D]",
+        )
+        dates = dates[~np.isin(dates, skip_array)]
+    return dates
+
+
 def date_to_str(
     date_obj: DateType,
     in_format_str: str = CLI_DATE_FORMAT_STR,
@@ -162,13 +162,16 @@ GDALFormatsType = Literal[
 GDALGeoTiffFormatStr: Final[str] = get_args(GDALFormatsType)[2]
 GDALNetCDFFormatStr: Final[str] = get_args(GDALFormatsType)[42]
 GDALVirtualFormatStr: Final[str] = get_args(GDALFormatsType)[0]
+GDALZarrFormatStr: Final[str] = get_args(GDALFormatsType)[146]
 
 TIF_EXTENSION_STR: Final[str] = "tif"
 NETCDF_EXTENSION_STR: Final[str] = "nc"
 VIRTUAL_EXTENSION_STR: Final[str] = "vrt"
+ZARR_EXTENSION_STR: Final[str] = "zarr"
 
 GDALFormatExtensions: Final[dict[str, str]] = {
     GDALGeoTiffFormatStr: TIF_EXTENSION_STR,
     GDALNetCDFFormatStr: NETCDF_EXTENSION_STR,
     GDALVirtualFormatStr: VIRTUAL_EXTENSION_STR,
+    GDALZarrFormatStr: ZARR_EXTENSION_STR,
 }
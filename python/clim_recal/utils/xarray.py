@@ -3,10 +3,14 @@ from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from itertools import islice
 from logging import getLogger
-from os import PathLike
+from multiprocessing import parent_process
+from os import PathLike, cpu_count
 from pathlib import Path
 from tempfile import NamedTemporaryFile, _TemporaryFileWrapper
+from threading import Lock
+from types import MappingProxyType
 from typing import Any, Callable, Final, Iterable, Sequence, overload
+from uuid import uuid4
 
 import numpy as np
 import rioxarray  # nopycln: import
@@ -21,13 +25,22 @@ from osgeo.gdal import (
     GDALWarpAppOptions,
     Translate,
     TranslateOptions,
+    Unlink,
+    VSIStatL,
     Warp,
     WarpOptions,
 )
 from osgeo.gdal import config_option as config_GDAL_option
 from rasterio.enums import Resampling
 from tqdm import tqdm
-from xarray import CFTimeIndex, DataArray, Dataset, cftime_range, open_dataset
+from xarray import (
+    CFTimeIndex,
+    DataArray,
+    Dataset,
+    cftime_range,
+    open_dataset,
+    set_options,
+)
 from xarray.coding.calendar_ops import convert_calendar
 from xarray.core.types import (
     CFCalendar,
@@ -68,6 +81,7 @@ from .data import (
 from .gdal_formats import (
     NETCDF_EXTENSION_STR,
     TIF_EXTENSION_STR,
+    ZARR_EXTENSION_STR,
     GDALFormatsType,
     GDALGeoTiffFormatStr,
     GDALNetCDFFormatStr,
@@ -93,13 +107,57 @@ HADS_DROP_VARS_AFTER_PROJECTION: Final[tuple[str, ...]] = ("longitude", "latitud
 FINAL_RESAMPLE_LON_COL: Final[str] = "x"
 FINAL_RESAMPLE_LAT_COL: Final[str] = "y"
 
+# Spatial dimensions `plot_xarray` decimates when passed a `stride`
+SPATIAL_DIM_NAMES: Final[tuple[str, ...]] = (
+    FINAL_RESAMPLE_LON_COL,
+    FINAL_RESAMPLE_LAT_COL,
+    HADS_RAW_X_COLUMN_NAME,
+    HADS_RAW_Y_COLUMN_NAME,
+    CPM_RAW_X_COLUMN_NAME,
+    CPM_RAW_Y_COLUMN_NAME,
+)
+
 DEFAULT_WARP_DICT_OPTIONS: dict[str, str | float] = {
     "VARIABLES_AS_BANDS": "YES",
     "GDAL_NETCDF_VERIFY_DIMS": "STRICT",
 }
+# `gdal` warp option set by `gdal_warp_wrapper` if passed `num_threads`
+WARP_NUM_THREADS_KEY: Final[str] = "NUM_THREADS"
 
 TQDM_FILE_NAME_PRINT_CHARS_INDEX: Final[int] = -7
 
+# GDAL in memory file system for intermediate files
+GDAL_VSIMEM_PATH: Final[Path] = Path("/vsimem")
+
+FAST_LIMIT_1_INTERPOLATE_METHODS: Final[tuple[str, ...]] = ("nearest", "linear")
+# Without `extrapolate` `interpolate_na` leaves `nan` values at either end
+INTERPOLATE_NA_FILL_VALUE: Final[str] = "extrapolate"
+
+_EMPTY_KWARGS: Final[MappingProxyType] = MappingProxyType({})
+
+DEFAULT_ZARR_CHUNKS: Final[dict[str, int]] = {
+    TIME_COLUMN_NAME: 365,
+    FINAL_RESAMPLE_LON_COL: 256,
+    FINAL_RESAMPLE_LAT_COL: 256,
+}
+# `numcodecs` `Blosc` settings for `zarr_chunk_encoding` `compress`
+ZARR_BLOSC_CNAME: Final[str] = "zstd"
+ZARR_BLOSC_CLEVEL: Final[int] = 3
+
+DEFAULT_NETCDF_CHUNKS: Final[dict[str, int]] = {
+    TIME_COLUMN_NAME: 30,
+    FINAL_RESAMPLE_LON_COL: 128,
+    FINAL_RESAMPLE_LAT_COL: 128,
+}
+DEFAULT_NETCDF_COMPLEVEL: Final[int] = 4
+# Existing `encoding` keys to keep when writing with `netcdf_chunk_encoding`
+NETCDF_KEEP_ENCODING_KEYS: Final[tuple[str, ...]] = (
+    "_FillValue",
+    "dtype",
+    "scale_factor",
+    "add_offset",
+)
+
 
 def cpm_xarray_to_standard_calendar(
     cpm_xr_time_series: T_Dataset | PathLike, include_bnds_index: bool = False
@@ -129,9 +187,11 @@ def cpm_xarray_to_standard_calendar(
     cpm_to_std_calendar["year"] = cpm_to_std_calendar.year.interpolate_na(
         "time", fill_value="extrapolate"
     )
-    yyyymmdd_fix: T_DataArray = cpm_to_std_calendar.time.dt.strftime(
-        CLI_DATE_FORMAT_STR
-    )
+    # Equivalent to `.dt.strftime(CLI_DATE_FORMAT_STR)` without per date `strftime`
+    std_time: T_DataArray = cpm_to_std_calendar.time
+    yyyymmdd_fix: T_DataArray = (
+        std_time.dt.year * 10000 + std_time.dt.month * 100 + std_time.dt.day
+    ).astype("U8")
     cpm_to_std_calendar["yyyymmdd"] = yyyymmdd_fix
     assert cpm_xr_time_series.rio.crs == cpm_to_std_calendar.rio.crs
     if include_bnds_index:
@@ -228,6 +288,7 @@ def cpm_reproject_with_standard_calendar(
     variable_name: str | None = None,
     close_temp_paths: bool = True,
     force: bool = False,
+    in_memory_warp: bool = True,
 ) -> T_Dataset:
     """Convert raw `cpm_xr_time_series` to an 365/366 days and 27700 coords.
 
@@ -243,6 +304,9 @@ def cpm_reproject_with_standard_calendar(
     variable_name
         Name of variable used, usually a measure of climate change like
         `tasmax` and `tasmin`.
+    in_memory_warp
+        Whether to write the intermediate warped `tif` to `GDAL_VSIMEM_PATH`
+        rather than a temporary file on disk.
 
     Returns
     -------
@@ -287,7 +351,7 @@ def cpm_reproject_with_standard_calendar(
     temp_cpm: _TemporaryFileWrapper = NamedTemporaryFile(
         suffix="." + NETCDF_EXTENSION_STR
     )
-    temp_tif: _TemporaryFileWrapper = NamedTemporaryFile(suffix="." + TIF_EXTENSION_STR)
+    temp_tif: _TemporaryFileWrapper | None = None
     temp_translated_ncf: _TemporaryFileWrapper = NamedTemporaryFile(
         suffix="." + NETCDF_EXTENSION_STR
     )
@@ -296,21 +360,33 @@ def cpm_reproject_with_standard_calendar(
         cpm_xr_time_series = temp_cpm.name
         xr_time_series_instance.to_netcdf(cpm_xr_time_series)
     assert isinstance(cpm_xr_time_series, PathLike | str)
-    gdal_warp_wrapper(
-        cpm_xr_time_series,
-        output_path=Path(temp_tif.name),
-        format=GDALGeoTiffFormatStr,
-        use_tqdm_progress_bar=False,
-        # Leaving this if further projection is needed
-        # resampling_method=VariableOptions.resampling_method(variable=variable_name).name,
-    )
-    gdal_translate_wrapper(
-        input_path=Path(temp_tif.name),
-        output_path=Path(temp_translated_ncf.name),
-        use_tqdm_progress_bar=False,
-        # Leaving this if further projection is needed
-        # resampling_method=VariableOptions.resampling_method(variable=variable_name).name,
-    )
+    warped_tif_path: Path
+    if in_memory_warp:
+        # Named without creating a file on disk
+        warped_tif_path = GDAL_VSIMEM_PATH / f"{uuid4().hex}.{TIF_EXTENSION_STR}"
+    else:
+        temp_tif = NamedTemporaryFile(suffix="." + TIF_EXTENSION_STR)
+        warped_tif_path = Path(temp_tif.name)
+    try:
+        gdal_warp_wrapper(
+            cpm_xr_time_series,
+            output_path=warped_tif_path,
+            format=GDALGeoTiffFormatStr,
+            use_tqdm_progress_bar=False,
+            # Leaving this if further projection is needed
+            # resampling_method=VariableOptions.resampling_method(variable=variable_name).name,
+        )
+        gdal_translate_wrapper(
+            input_path=warped_tif_path,
+            output_path=Path(temp_translated_ncf.name),
+            use_tqdm_progress_bar=False,
+            # Leaving this if further projection is needed
+            # resampling_method=VariableOptions.resampling_method(variable=variable_name).name,
+        )
+    finally:
+        # Free the in memory `tif` even if warping or translating raises
+        if in_memory_warp and VSIStatL(str(warped_tif_path)) is not None:
+            Unlink(str(warped_tif_path))
     reprojected_cpm_xr_time_series, _ = check_xarray_path_and_var_name(
         Path(temp_translated_ncf.name), variable_name
     )
@@ -323,11 +399,32 @@ def cpm_reproject_with_standard_calendar(
     )
     if close_temp_paths:
         temp_cpm.close()
-        temp_tif.close()
+        if temp_tif:
+            temp_tif.close()
         temp_translated_ncf.close()
     return standard_calendar_ts
 
 
+def warp_num_threads() -> int:
+    """Return a `num_threads` to opt in to multithreaded warping.
+
+    Notes
+    -----
+    Warps default to a single thread. This is a suggested value to pass
+    as `num_threads` to `xr_reproject_crs` or `gdal_warp_wrapper`: `1`
+    within a `multiprocessing` worker (e.g. via `multiprocess_execute`),
+    where each process already runs on its own core, otherwise all
+    available cores. Processes started other ways (e.g. `pytest-xdist`
+    workers) are not detected, so only pass it from a single process.
+
+    Examples
+    --------
+    >>> warp_num_threads() == (cpu_count() or 1)
+    True
+    """
+    return 1 if parent_process() else (cpu_count() or 1)
+
+
 def xr_reproject_crs(
     xr_time_series: T_Dataset | PathLike,
     x_dim_name: str = CPM_RAW_X_COLUMN_NAME,
@@ -340,6 +437,7 @@ def xr_reproject_crs(
     match_xr_time_series_load_kwargs: dict[str, Any] | None = None,
     resampling_method: Resampling = DEFAULT_RESAMPLING_METHOD,
     nodata: float = np.nan,
+    num_threads: int | None = None,
     **kwargs,
 ) -> T_Dataset:
     """Reproject `source_xr` to `target_xr` coordinate structure.
@@ -361,6 +459,10 @@ def xr_reproject_crs(
         Coordinate system `str` to project `xr_time_series` to.
     resampling_method
         `rasterio` resampling method to apply.
+    num_threads
+        Number of threads `rasterio` uses for warping. If `None`, the
+        `rasterio` default (a single thread) is used. See
+        `warp_num_threads`.
 
     Examples
     --------
@@ -387,6 +489,8 @@ def xr_reproject_crs(
     xr_time_series, variable_name = check_xarray_path_and_var_name(
         xr_time_series, variable_name
     )
+    if num_threads is not None:
+        kwargs["num_threads"] = num_threads
     xr_time_series = xr_time_series.rio.set_spatial_dims(
         x_dim=x_dim_name, y_dim=y_dim_name, inplace=True
     )
@@ -434,11 +538,17 @@ def xr_reproject_crs(
             else:
                 raise ValueError("Can't match dim names.")
         without_attributes_reprojected = without_attributes.rio.reproject_match(
-            match_xr_time_series, resampling=resampling_method, nodata=nodata, **kwargs
+            match_xr_time_series,
+            resampling=resampling_method,
+            nodata=nodata,
+            **kwargs,
         )
     else:
         without_attributes_reprojected: T_DataArray = without_attributes.rio.reproject(
-            final_crs, resampling=resampling_method, nodata=nodata, **kwargs
+            final_crs,
+            resampling=resampling_method,
+            nodata=nodata,
+            **kwargs,
         )
     final_dataset: T_Dataset = Dataset({variable_name: without_attributes_reprojected})
     return final_dataset.rio.write_crs(BRITISH_NATIONAL_GRID_EPSG)
@@ -512,6 +622,7 @@ def plot_xarray(
     path: PathLike | None = None,
     time_stamp: bool = False,
     return_path: bool = True,
+    stride: int | None = None,
     **kwargs,
 ) -> Path | Figure | None:
     """Plot `da` with `**kwargs` to `path`.
@@ -524,6 +635,11 @@ def plot_xarray(
         File to write plot to.
     time_stamp
         Whather to add a `datetime` `str` of time of writing in file name.
+    return_path
+        Whether to return `path` (else the plot `Figure`).
+    stride
+        Plot every `stride` point of `SPATIAL_DIM_NAMES` dimensions,
+        a quick thumbnail for large grids.
     kwargs
         Additional parameters to pass to `plot`.
 
@@ -544,7 +660,20 @@ def plot_xarray(
     True
     >>> print(timed_image_path)
     /.../test-path/example-stamped_...-...-..._...png
+    >>> example_thumbnail: Path = example_path.parent / 'example-thumb.png'
+    >>> plot_xarray(
+    ...     xarray_spatial_4_days, example_thumbnail, stride=2
+    ... ) == example_thumbnail
+    True
     """
+    if stride and stride > 1:
+        da = da.isel(
+            {
+                dim: slice(None, None, stride)
+                for dim in da.dims
+                if dim in SPATIAL_DIM_NAMES
+            }
+        )
     fig: Figure = da.plot(**kwargs)
     if path:
         path = Path(path)
@@ -614,7 +743,8 @@ def join_xr_time_series_var(
     Data variables:
         tasmax   (time) float64 ... 8.221 6.716 6.499 7.194 ... 8.456 8.153 5.501
     """
-    results: list[tuple[Any, float]] = []
+    dates: list[NDArray] = []
+    values: list[NDArray] = []
     for nc_path in islice(Path(path).glob(regex), start, stop, step):
         xr_time_series, nc_var_name = check_xarray_path_and_var_name(
             nc_path, variable_name=variable_name
@@ -625,12 +755,17 @@ def join_xr_time_series_var(
             assert variable_name == nc_var_name
         except AssertionError:
             raise ValueError(f"'{nc_var_name}' should match '{variable_name}'")
-        results += [
-            (date_obj, getattr(val, method_name)().values.item())
-            for date_obj, val in xr_time_series[variable_name].groupby(time_dim_name)
-        ]
-    data_vars = {variable_name: ([time_dim_name], [data[1] for data in results])}
-    coords = {time_dim_name: (time_dim_name, [data[0] for data in results])}
+        # Summarise every time point in one reduction rather than per group
+        member: T_DataArray = xr_time_series[variable_name]
+        summary: T_DataArray = getattr(member, method_name)(
+            dim=[dim for dim in member.dims if dim != time_dim_name]
+        )
+        dates.append(summary[time_dim_name].values)
+        values.append(summary.values.astype("float64"))
+    data_vars = {
+        variable_name: ([time_dim_name], np.concatenate(values) if values else [])
+    }
+    coords = {time_dim_name: (time_dim_name, np.concatenate(dates) if dates else [])}
     return Dataset(data_vars=data_vars, coords=coords).sortby(time_dim_name)
 
 
@@ -828,6 +963,7 @@ def convert_xr_calendar(
     # extrapolate_fill_value: bool = True,
     check_cftime_cols: tuple[str] | None = None,
     cftime_range_gen_kwargs: dict[str, Any] | None = None,
+    vectorized_linear: bool = False,
     # This may need to be removed
     # **kwargs,
 ) -> T_DataArrayOrSet:
@@ -870,6 +1006,8 @@ def convert_xr_calendar(
         Columns to check `cftime` format on
     cftime_range_gen_kwargs
         Any `kwargs` to pass to `cftime_range_gen`
+    vectorized_linear
+        Passed to `interpolate_xr_ts_nans` if `interpolate_na` is `True`.
 
     Raises
     ------
@@ -924,8 +1062,10 @@ def convert_xr_calendar(
             )
         else:
             xr_time_series = open_dataset(xr_time_series, engine=engine)
-    if ensure_output_type_is_dataset:
+    if ensure_output_type_is_dataset and not isinstance(xr_time_series, Dataset):
         xr_time_series = ensure_xr_dataset(xr_time_series)
+    # Each `rio` access rebuilds the accessor and parses the `crs`
+    src_crs = xr_time_series.rio.crs if keep_crs else None
     calendar_converted_ts: T_DataArrayOrSet = convert_calendar(
         xr_time_series,
         calendar,
@@ -934,9 +1074,8 @@ def convert_xr_calendar(
         use_cftime=use_cftime,
     )
     if not interpolate_na:
-        if keep_crs and xr_time_series.rio.crs:
-            assert xr_time_series.rio.crs
-            return calendar_converted_ts.rio.write_crs(xr_time_series.rio.crs)
+        if src_crs and calendar_converted_ts.rio.crs != src_crs:
+            return calendar_converted_ts.rio.write_crs(src_crs)
         else:
             return calendar_converted_ts
     else:
@@ -949,6 +1088,7 @@ def convert_xr_calendar(
             keep_attrs=keep_attrs,
             limit=limit,
             cftime_range_gen_kwargs=cftime_range_gen_kwargs,
+            vectorized_linear=vectorized_linear,
         )
 
 
@@ -961,6 +1101,8 @@ def interpolate_xr_ts_nans(
     keep_attrs: bool = True,
     limit: int = 1,
     cftime_range_gen_kwargs: dict[str, Any] | None = None,
+    fast_limit_1: bool = True,
+    vectorized_linear: bool = False,
     **kwargs,
 ) -> T_Dataset:
     """Interpolate `nan` values in a `Dataset` time series.
@@ -989,28 +1131,54 @@ def interpolate_xr_ts_nans(
         How many `nan` are allowed either side of data point to interpolate. See Notes.
     cftime_range_gen_kwargs
         Any `cftime_range_gen` arguments to use with `check_cftime_cols` calls.
+    fast_limit_1
+        If `limit` is 1 and `interpolate_method` is in
+        `FAST_LIMIT_1_INTERPOLATE_METHODS` and no `kwargs` are passed, try
+        filling isolated `nan` values without `scipy` interpolation. See
+        `_shift_fill_limit_1`.
+    vectorized_linear
+        If `interpolate_method` is `linear` and `keep_attrs`, try filling
+        via `linear_interpolate_gaps` rather than `scipy` interpolation.
 
     Returns
     -------
     `Dataset` where `xr_ts` `nan` values are iterpolated with respect to the `time` coordinate.
     """
-    if check_cftime_cols is None:
-        check_cftime_cols = tuple()
-    if cftime_range_gen_kwargs is None:
-        cftime_range_gen_kwargs = dict()
+    check_cftime_cols = check_cftime_cols or ()
+    cftime_range_gen_kwargs = cftime_range_gen_kwargs or _EMPTY_KWARGS
     original_xr_ts = original_xr_ts if original_xr_ts else xr_ts
-
-    # Ensure `fill_value` is set to `extrapolate`
-    # Without this the `nan` values don't get filled
-    kwargs["fill_value"] = "extrapolate"
-
-    interpolated_ts: T_Dataset = xr_ts.interpolate_na(
-        dim="time",
-        method=interpolate_method,
-        keep_attrs=keep_attrs,
-        limit=limit,
-        **kwargs,
-    )
+    src_crs = original_xr_ts.rio.crs if keep_crs else None
+
+    interpolated_ts: T_Dataset | None = None
+    if keep_attrs and not _has_nan(xr_ts):
+        # Nothing to interpolate, e.g. `missing=None` or standard to standard.
+        # Shallow copy so `check_cftime_cols` fixes leave `xr_ts` unchanged
+        interpolated_ts = xr_ts.copy(deep=False)
+    elif (
+        fast_limit_1
+        and limit == 1
+        and interpolate_method in FAST_LIMIT_1_INTERPOLATE_METHODS
+        # e.g. `max_gap` only applies via `interpolate_na`
+        and not kwargs
+    ):
+        interpolated_ts = _shift_fill_limit_1(
+            xr_ts, interpolate_method=interpolate_method, keep_attrs=keep_attrs
+        )
+    if (
+        interpolated_ts is None
+        and vectorized_linear
+        and keep_attrs
+        and interpolate_method == "linear"
+    ):
+        interpolated_ts = _linear_interpolate_time(xr_ts, limit=limit)
+    if interpolated_ts is None:
+        interpolated_ts = xr_ts.interpolate_na(
+            dim="time",
+            method=interpolate_method,
+            keep_attrs=keep_attrs,
+            limit=limit,
+            **{**kwargs, "fill_value": INTERPOLATE_NA_FILL_VALUE},
+        )
     for cftime_col in check_cftime_cols:
         if cftime_col in interpolated_ts:
             cftime_fix: NDArray = cftime_range_gen(
@@ -1020,12 +1188,214 @@ def interpolate_xr_ts_nans(
                 interpolated_ts[cftime_col].dims,
                 cftime_fix,
             )
-    if keep_crs and original_xr_ts.rio.crs:
-        return interpolated_ts.rio.write_crs(xr_ts.rio.crs)
+    if src_crs and interpolated_ts.rio.crs != src_crs:
+        return interpolated_ts.rio.write_crs(src_crs)
     else:
         return interpolated_ts
 
 
+def _has_nan(xr_ts: T_DataArrayOrSet) -> bool:
+    """Return whether any variable in `xr_ts` has a `nan` value.
+
+    Examples
+    --------
+    >>> _has_nan(Dataset({'tasmax': ('time', [1.0, 2.0])}))
+    False
+    >>> _has_nan(Dataset({'tasmax': ('time', [1.0, np.nan])}))
+    True
+    """
+    variables: Iterable[T_DataArray] = (
+        xr_ts.data_vars.values() if isinstance(xr_ts, Dataset) else (xr_ts,)
+    )
+    return any(bool(variable.isnull().any()) for variable in variables)
+
+
+def _shift_fill_limit_1(
+    xr_ts: T_Dataset,
+    interpolate_method: InterpOptions = DEFAULT_INTERPOLATION_METHOD,
+    keep_attrs: bool = True,
+    time_dim_name: str = TIME_COLUMN_NAME,
+) -> T_Dataset | None:
+    """Fill isolated `nan` values along `time_dim_name` without `scipy`.
+
+    Notes
+    -----
+    For single `nan` gaps (like those added converting 360 day calendars)
+    `linear` weights both neighbours by `time_dim_name` via
+    `_linear_interpolate_time`. On evenly spaced `time_dim_name` values
+    `nearest` with `extrapolate` selects the previous value (or the only
+    neighbour at either end), filled here from `shift`ed neighbours to
+    avoid `interp1d` setup costs. `None` is returned (to fall back on
+    `interpolate_na`) unless all `time_dim_name` variables are floating
+    point without consecutive `nan` values, if any cell has only one
+    valid value (which `interpolate_na` leaves unfilled), for `nearest`
+    unless `time_dim_name` is evenly spaced, and for `linear` if there
+    are `nan` values at either end.
+
+    Examples
+    --------
+    >>> with_gaps: T_Dataset = Dataset(
+    ...     {'tasmax': ('time', [np.nan, 1.0, np.nan, 3.0, np.nan])})
+    >>> _shift_fill_limit_1(with_gaps, 'nearest').tasmax.values
+    array([1., 1., 1., 3., 3.])
+    >>> _shift_fill_limit_1(with_gaps, 'linear') is None
+    True
+    >>> _shift_fill_limit_1(
+    ...     with_gaps.isel(time=slice(1, 4)), 'linear').tasmax.values
+    array([1., 2., 3.])
+    >>> uneven: T_Dataset = Dataset(
+    ...     {'tasmax': ('time', [1.0, np.nan, 10.0, 11.0])},
+    ...     coords={'time': np.array(
+    ...         ['1980-01-01', '1980-01-02', '1980-01-10', '1980-01-11'],
+    ...         dtype='datetime64[ns]')})
+    >>> _shift_fill_limit_1(uneven, 'linear').tasmax.values
+    array([ 1.,  2., 10., 11.])
+    >>> _shift_fill_limit_1(uneven, 'nearest') is None
+    True
+    >>> _shift_fill_limit_1(
+    ...     Dataset({'tasmax': ('time', [np.nan, 1.0, np.nan])}), 'nearest') is None
+    True
+    """
+    if not isinstance(xr_ts, Dataset):
+        return None
+    time_vars: list[str] = [
+        name for name, var in xr_ts.data_vars.items() if time_dim_name in var.dims
+    ]
+    if not time_vars or not all(
+        np.issubdtype(xr_ts[name].dtype, np.floating) for name in time_vars
+    ):
+        return None
+    is_null: T_Dataset = xr_ts[time_vars].isnull()
+    is_consecutive_null: T_Dataset = is_null & is_null.shift(
+        {time_dim_name: 1}, fill_value=False
+    )
+    if is_consecutive_null.to_array().any():
+        return None
+    if ((~is_null).sum(time_dim_name) == 1).to_array().any():
+        return None
+    if interpolate_method == "linear":
+        return _linear_interpolate_time(xr_ts, limit=1, time_dim_name=time_dim_name)
+    if time_dim_name in xr_ts.indexes and (
+        np.unique(np.diff(xr_ts.indexes[time_dim_name].asi8)).size > 1
+    ):
+        return None
+    with set_options(keep_attrs=keep_attrs):
+        filled: T_Dataset = (
+            xr_ts[time_vars]
+            .fillna(xr_ts[time_vars].shift({time_dim_name: 1}))
+            .fillna(xr_ts[time_vars].shift({time_dim_name: -1}))
+        )
+    return xr_ts.assign(dict(filled.data_vars))
+
+
+def linear_interpolate_gaps(
+    values: NDArray, x: NDArray | None = None, limit: int | None = None
+) -> NDArray:
+    """Linearly interpolate `nan` gaps within `values` along the first axis.
+
+    Notes
+    -----
+    Equivalent to `interpolate_na` with `method='linear'` for `nan`
+    values between valid points, including `limit` filling at most
+    `limit` consecutive `nan` values after each valid point. Leading and
+    trailing `nan` values are not extrapolated.
+
+    Parameters
+    ----------
+    values
+        Floating point array with time as the first axis.
+    x
+        Numeric time coordinates to weight interpolation by. Defaults to
+        equally spaced indices.
+    limit
+        Maximum consecutive `nan` values to fill in each gap.
+
+    Returns
+    -------
+    :
+        A copy of `values` with gaps interpolated.
+
+    Examples
+    --------
+    >>> gaps: NDArray = np.array(
+    ...     [1.0, np.nan, 3.0, np.nan, np.nan, np.nan, 7.0, np.nan])
+    >>> linear_interpolate_gaps(gaps)
+    array([ 1.,  2.,  3.,  4.,  5.,  6.,  7., nan])
+    >>> linear_interpolate_gaps(gaps, limit=2)
+    array([ 1.,  2.,  3.,  4.,  5., nan,  7., nan])
+    >>> linear_interpolate_gaps(gaps[:3], x=np.array([0, 3, 4]))
+    array([1. , 2.5, 3. ])
+    """
+    is_nan: NDArray = np.isnan(values)
+    count: int = values.shape[0]
+    index: NDArray = np.arange(count).reshape((count,) + (1,) * (values.ndim - 1))
+    prev_index: NDArray = np.maximum.accumulate(np.where(is_nan, -1, index), axis=0)
+    next_index: NDArray = np.minimum.accumulate(
+        np.where(is_nan, count, index)[::-1], axis=0
+    )[::-1]
+    to_fill: NDArray = is_nan & (prev_index >= 0) & (next_index < count)
+    if limit is not None:
+        to_fill &= index - prev_index <= limit
+    interpolated: NDArray = values.copy()
+    if not to_fill.any():
+        return interpolated
+    prev_index = prev_index[to_fill]
+    next_index = next_index[to_fill]
+    x = np.arange(count, dtype=float) if x is None else np.asarray(x, dtype=float)
+    x_fill: NDArray = np.broadcast_to(x.reshape(index.shape), values.shape)[to_fill]
+    weight: NDArray = (x_fill - x[prev_index]) / (x[next_index] - x[prev_index])
+    other_indices: tuple[NDArray, ...] = np.nonzero(to_fill)[1:]
+    prev_values: NDArray = values[(prev_index, *other_indices)]
+    next_values: NDArray = values[(next_index, *other_indices)]
+    interpolated[to_fill] = prev_values + (next_values - prev_values) * weight
+    return interpolated
+
+
+def _linear_interpolate_time(
+    xr_ts: T_Dataset,
+    limit: int | None = None,
+    time_dim_name: str = TIME_COLUMN_NAME,
+) -> T_Dataset | None:
+    """Apply `linear_interpolate_gaps` to all `time_dim_name` variables.
+
+    Notes
+    -----
+    `None` is returned (to fall back on `interpolate_na`) unless all
+    `time_dim_name` variables are floating point without `nan` values
+    at either end, which `interpolate_na` would extrapolate.
+
+    Examples
+    --------
+    >>> with_gaps: T_Dataset = Dataset(
+    ...     {'tasmax': ('time', [1.0, np.nan, np.nan, 4.0])})
+    >>> _linear_interpolate_time(with_gaps).tasmax.values
+    array([1., 2., 3., 4.])
+    >>> _linear_interpolate_time(with_gaps.isel(time=slice(1, 4))) is None
+    True
+    """
+    if not isinstance(xr_ts, Dataset):
+        return None
+    time_vars: list[str] = [
+        name for name, var in xr_ts.data_vars.items() if time_dim_name in var.dims
+    ]
+    if not time_vars or not all(
+        np.issubdtype(xr_ts[name].dtype, np.floating) for name in time_vars
+    ):
+        return None
+    if xr_ts[time_vars].isel({time_dim_name: [0, -1]}).isnull().to_array().any():
+        return None
+    x: NDArray | None = (
+        xr_ts.indexes[time_dim_name].asi8 if time_dim_name in xr_ts.indexes else None
+    )
+    filled: dict[str, T_DataArray] = {}
+    for name in time_vars:
+        time_first: T_DataArray = xr_ts[name].transpose(time_dim_name, ...)
+        filled[name] = time_first.copy(
+            data=linear_interpolate_gaps(time_first.values, x=x, limit=limit)
+        ).transpose(*xr_ts[name].dims)
+    return xr_ts.assign(filled)
+
+
 def _progress_bar_file_description(
     input_path: PathLike,
     prefix: str = "",
@@ -1104,6 +1474,7 @@ def gdal_warp_wrapper(
     tqdm_file_name_chars: int = TQDM_FILE_NAME_PRINT_CHARS_INDEX,
     resampling_method: Resampling | None = None,
     supress_warnings: bool = True,
+    num_threads: int | None = None,
     **kwargs,
 ) -> Path | GDALDataset:
     """Execute the `gdalwrap` function within `python`.
@@ -1146,10 +1517,22 @@ def gdal_warp_wrapper(
         Format to write new file to.
     multithread
         Whether to use `multithread` to speed up calculations.
+    warp_dict_options
+        `warpOptions` passed to `WarpOptions`.
+    num_threads
+        If set, added as `NUM_THREADS` to `warp_dict_options` so
+        `multithread` warps with more than one thread. See
+        `warp_num_threads`.
     kwargs
         Any additional parameters to pass to `WarpOption`.
     """
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    if num_threads is not None:
+        # Without this `multithread` only overlaps reading with a single warp thread
+        warp_dict_options = (warp_dict_options or {}) | {
+            WARP_NUM_THREADS_KEY: num_threads
+        }
+    if not Path(output_path).is_relative_to(GDAL_VSIMEM_PATH):
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
     if use_tqdm_progress_bar:
         description: str = _progress_bar_file_description(
             input_path=input_path,
@@ -1196,6 +1579,98 @@ def gdal_warp_wrapper(
     return output_path if return_path else projection
 
 
+def zarr_chunk_encoding(
+    xr_time_series: T_Dataset,
+    chunks: dict[str, int] | None = DEFAULT_ZARR_CHUNKS,
+    compress: bool = True,
+) -> dict[str, dict[str, Any]]:
+    """Return `to_zarr` `encoding` to chunk `xr_time_series` `data_vars`.
+
+    Parameters
+    ----------
+    xr_time_series
+        `Dataset` to generate `chunks` `encoding` for.
+    chunks
+        `dict` of `dim` name to maximum chunk length. Any `dim` not
+        included is written as a single chunk.
+    compress
+        Whether to add a `Blosc` `zstd` `compressor`. Requires `zarr`
+        (and its `numcodecs` dependency) to be installed.
+
+    Examples
+    --------
+    >>> zarr_chunk_encoding(ensure_xr_dataset(xarray_spatial_4_days),
+    ...                     compress=False)
+    {'xa_template': {'chunks': (5, 3)}}
+    >>> zarr_chunk_encoding(ensure_xr_dataset(xarray_spatial_4_years),
+    ...                     chunks={'time': 365}, compress=False)
+    {'xa_template': {'chunks': (365, 3)}}
+    >>> _ = pytest.importorskip('numcodecs')
+    >>> zarr_chunk_encoding(
+    ...     ensure_xr_dataset(xarray_spatial_4_days))['xa_template']['compressor']
+    Blosc(cname='zstd', clevel=3, shuffle=BITSHUFFLE, blocksize=0)
+    """
+    chunks = chunks or {}
+    compressor: dict[str, Any] = {}
+    if compress:
+        from numcodecs import Blosc  # Installed with `zarr`, not a dependency
+
+        compressor["compressor"] = Blosc(
+            cname=ZARR_BLOSC_CNAME, clevel=ZARR_BLOSC_CLEVEL, shuffle=Blosc.BITSHUFFLE
+        )
+    return {
+        variable_name: {"chunks": _chunk_lengths(data_array, chunks)} | compressor
+        for variable_name, data_array in xr_time_series.data_vars.items()
+    }
+
+
+def _chunk_lengths(data_array: T_DataArray, chunks: dict[str, int]) -> tuple[int, ...]:
+    """Return `data_array` chunk lengths, capped by `chunks` per `dim`."""
+    return tuple(
+        min(chunks.get(dim, size), size)
+        for dim, size in zip(data_array.dims, data_array.shape)
+    )
+
+
+def netcdf_chunk_encoding(
+    xr_time_series: T_Dataset,
+    chunks: dict[str, int] | None = DEFAULT_NETCDF_CHUNKS,
+    complevel: int = DEFAULT_NETCDF_COMPLEVEL,
+) -> dict[str, dict[str, Any]]:
+    """Return `to_netcdf` `encoding` to chunk and compress `xr_time_series`.
+
+    Parameters
+    ----------
+    xr_time_series
+        `Dataset` to generate `chunksizes` and `zlib` `encoding` for.
+    chunks
+        `dict` of `dim` name to maximum chunk length. Any `dim` not
+        included is written as a single chunk.
+    complevel
+        `zlib` compression level from 1 (fastest) to 9 (smallest).
+
+    Examples
+    --------
+    >>> netcdf_chunk_encoding(ensure_xr_dataset(xarray_spatial_4_years))
+    {'xa_template': {'zlib': True, 'complevel': 4, 'chunksizes': (30, 3)}}
+    """
+    chunks = chunks or {}
+    return {
+        variable_name: {
+            key: data_array.encoding[key]
+            for key in NETCDF_KEEP_ENCODING_KEYS
+            if key in data_array.encoding
+        }
+        | {
+            "zlib": True,
+            "complevel": complevel,
+            "chunksizes": _chunk_lengths(data_array, chunks),
+        }
+        for variable_name, data_array in xr_time_series.data_vars.items()
+        if data_array.ndim
+    }
+
+
 def apply_geo_func(
     source_path: PathLike,
     func: ReprojectFuncType,
@@ -1203,8 +1678,12 @@ def apply_geo_func(
     new_path_name_func: Callable[[Path], Path] | None = None,
     to_netcdf: bool = True,
     to_raster: bool = False,
+    to_zarr: bool = False,
+    netcdf_chunks: dict[str, int] | None = None,
+    zarr_chunks: dict[str, int] | None = DEFAULT_ZARR_CHUNKS,
     export_path_as_output_path_kwarg: bool = False,
     return_results: bool = False,
+    engine: XArrayEngineType | None = None,
     **kwargs,
 ) -> Path | T_Dataset | GDALDataset:
     """Apply a `Callable` to `netcdf_source` file and export via `to_netcdf`.
@@ -1223,12 +1702,26 @@ def apply_geo_func(
         Whether to call `to_netcdf()` method on `results` `Dataset`.
     to_raster
         Whether to call `rio.to_raster()` on `results` `Dataset`.
+    to_zarr
+        Whether to call `to_zarr()` on `results` `Dataset`, saving to
+        `export_path` with a `.zarr` suffix. Requires `zarr` to be
+        installed.
+    netcdf_chunks
+        `dim` chunk lengths passed to `netcdf_chunk_encoding` if
+        `to_netcdf`, e.g. `DEFAULT_NETCDF_CHUNKS`. If `None` (the
+        default), write without chunking or compression.
+    zarr_chunks
+        `dim` chunk lengths passed to `zarr_chunk_encoding` if `to_zarr`.
     export_path_as_output_path_kwarg
         Whether to add `output_path = export_path` to `kwargs` passed to
         `func`. Meant for cases calling `gdal_warp_wrapper`.
     return_results
         Whether to return results, which would be a `Dataset` or
         `GDALDataset` (the latter if `gdal_warp_wrapper` is used).
+    engine
+        Which `XArrayEngineType` to open `func` results with if
+        `func` returns a `Path`. If `None`, `xarray` infers it from the
+        file, e.g. `rasterio` for `.tif` `gdal_warp_wrapper` outputs.
     **kwargs
         Other parameters passed to `func` call.
 
@@ -1249,9 +1742,18 @@ def apply_geo_func(
     if export_path_as_output_path_kwarg:
         kwargs["output_path"] = export_path
     results: T_Dataset | Path | GDALDataset = func(source_path, **kwargs)
-    if to_netcdf or to_raster:
+    if (
+        isinstance(results, Path)
+        and results == export_path
+        and (to_netcdf or to_raster)
+        and not to_zarr
+    ):
+        # `func` already wrote to `export_path` (e.g. via `output_path`),
+        # so skip reading it back only to write it again
+        return open_dataset(results, engine=engine) if return_results else export_path
+    if to_netcdf or to_raster or to_zarr:
         if isinstance(results, Path):
-            results = open_dataset(results)
+            results = open_dataset(results, engine=engine)
         if isinstance(results, GDALDataset):
             raise TypeError(
                 f"Restuls from 'gdal_warp_wrapper' can't directly export to NetCDF form, only return a Path or GDALDataset"
@@ -1265,9 +1767,31 @@ def apply_geo_func(
             else:
                 raise FileExistsError(f"Cannot overwrite: '{export_path}'")
         if to_netcdf:
-            results.to_netcdf(export_path)
+            # Opt-in bounded chunks let later reads of a few time steps skip the rest
+            results.to_netcdf(
+                export_path,
+                encoding=(
+                    netcdf_chunk_encoding(results, chunks=netcdf_chunks)
+                    if netcdf_chunks is not None
+                    else None
+                ),
+            )
         if to_raster:
-            results.rio.to_raster(export_path)
+            if results.chunks:
+                # Write `dask` chunks in parallel rather than loading all of `results`
+                results.rio.to_raster(export_path, tiled=True, lock=Lock())
+            else:
+                results.rio.to_raster(export_path)
+        if to_zarr:
+            zarr_path: Path = export_path.with_suffix("." + ZARR_EXTENSION_STR)
+            if zarr_path.exists():
+                raise FileExistsError(f"Cannot overwrite: '{zarr_path}'")
+            results.to_zarr(
+                zarr_path,
+                encoding=zarr_chunk_encoding(results, chunks=zarr_chunks),
+            )
+            if not to_netcdf and not to_raster:
+                export_path = zarr_path
     if return_results:
         return results
     else:
@@ -1319,49 +1843,91 @@ def file_name_to_start_end_dates(
     >>> len(dates)
     366
     """
-    date_range_path: Path = Path(Path(path).name.split("_")[-1])
-    date_strs: list[str] = date_range_path.stem.split("-")
+    date_range_str: str = Path(path).name.rsplit("_", 1)[-1].rsplit(".", 1)[0]
+    date_strs: list[str] = date_range_str.split("-")
     try:
         assert len(date_strs) == 2
     except AssertionError:
         raise ValueError(
-            f"Maximum of 2 date strs in YYYMMDD form allowed from: '{date_range_path}'"
+            f"Maximum of 2 date strs in YYYMMDD form allowed from: '{date_range_str}'"
         )
-    start_date: date = datetime.strptime(date_strs[0], date_format)
-    end_date: date = datetime.strptime(date_strs[1], date_format)
+    start_date: datetime
+    end_date: datetime
+    if date_format == CLI_DATE_FORMAT_STR:
+        # Avoid `strptime` format parsing for the default `YYYYMMDD` file names
+        start_date = _cli_date_str_to_datetime(date_strs[0])
+        end_date = _cli_date_str_to_datetime(date_strs[1])
+    else:
+        start_date = datetime.strptime(date_strs[0], date_format)
+        end_date = datetime.strptime(date_strs[1], date_format)
     return start_date, end_date
 
 
+def _cli_date_str_to_datetime(date_str: str) -> datetime:
+    """Return a `datetime` from a `CLI_DATE_FORMAT_STR` (`YYYYMMDD`) `str`.
+
+    Examples
+    --------
+    >>> _cli_date_str_to_datetime('20761201')
+    datetime.datetime(2076, 12, 1, 0, 0)
+    >>> _cli_date_str_to_datetime('2076121')
+    Traceback (most recent call last):
+        ...
+    ValueError: '2076121' does not match format '%Y%m%d'
+    """
+    if len(date_str) != 8 or not date_str.isdigit():
+        raise ValueError(f"'{date_str}' does not match format '{CLI_DATE_FORMAT_STR}'")
+    return datetime(int(date_str[:4]), int(date_str[4:6]), int(date_str[6:]))
+
+
 def generate_360_to_standard(array_to_expand: T_DataArray) -> T_DataArray:
     """Return `array_to_expand` 360 days expanded to 365 or 366 days.
 
     This may be dropped if `cpm_reproject_with_standard_calendar` is successful.
+
+    Examples
+    --------
+    >>> expanded: T_DataArray = generate_360_to_standard(
+    ...     DataArray(np.arange(360)))
+    >>> len(expanded)
+    365
+    >>> expanded[70:75].values
+    array([70., 71., nan, 72., 73.])
+    >>> int(expanded.isnull().sum())
+    5
     """
     initial_days: int = len(array_to_expand)
     assert initial_days == 360
     extra_days: int = 5
     index_block_length: int = int(initial_days / extra_days)  # 72
-    expanded_index: list[int] = []
-    for i in range(extra_days):
-        start_index: int = i * index_block_length
-        stop_index: int = (i + 1) * index_block_length
-        slice_to_append: list[int] = array_to_expand[start_index:stop_index]
-        expanded_index.append(slice_to_append)
-        if i < extra_days - 1:
-            expanded_index.append(np.nan)
-    return DataArray(expanded_index)
+    expanded: NDArray = np.full(
+        initial_days + extra_days,
+        np.nan,
+        dtype=np.result_type(array_to_expand.dtype, np.float32),
+    )
+    # Each block of 72 days is followed by a single `nan` day
+    expanded.reshape(extra_days, index_block_length + 1)[:, :index_block_length] = (
+        np.asarray(array_to_expand).reshape(extra_days, index_block_length)
+    )
+    return DataArray(expanded, dims=array_to_expand.dims)
 
 
 def cftime_range_gen(time_data_array: T_DataArray, **kwargs) -> NDArray:
     """Convert a banded time index a banded standard (Gregorian)."""
     assert hasattr(time_data_array, "time")
+    # Only format the first and last `time` values
+    start_str, end_str = (
+        time_data_array.time[[0, -1]].dt.strftime(ISO_DATE_FORMAT_STR).values
+    )
     time_bnds_fix_range_start: CFTimeIndex = cftime_range(
-        time_data_array.time.dt.strftime(ISO_DATE_FORMAT_STR).values[0],
-        time_data_array.time.dt.strftime(ISO_DATE_FORMAT_STR).values[-1],
+        start_str,
+        end_str,
         **kwargs,
     )
-    time_bnds_fix_range_end: CFTimeIndex = time_bnds_fix_range_start + timedelta(days=1)
-    return np.array((time_bnds_fix_range_start, time_bnds_fix_range_end)).T
+    time_bnds: NDArray = np.empty((len(time_bnds_fix_range_start), 2), dtype=object)
+    time_bnds[:, 0] = time_bnds_fix_range_start
+    time_bnds[:, 1] = time_bnds_fix_range_start + timedelta(days=1)
+    return time_bnds
 
 
 def get_cpm_for_coord_alignment(
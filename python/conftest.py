@@ -1,13 +1,16 @@
 import asyncio
 from argparse import BooleanOptionalAction
-from os import PathLike
+from os import PathLike, environ
 from pathlib import Path
 from pprint import pprint
 from shutil import copytree, rmtree
 from typing import Final, Iterator
 
+import matplotlib
+import numpy as np
 import pytest
 from coverage_badge.__main__ import main as gen_cov_badge
+from numpy.typing import NDArray
 from xarray import DataArray, Dataset, open_dataset
 from xarray.core.types import T_Dataset
 
@@ -22,10 +25,13 @@ from clim_recal.utils.core import (
     results_path,
 )
 from clim_recal.utils.data import BoundsTupleType
+from clim_recal.utils.gdal_formats import NETCDF_EXTENSION_STR
 from clim_recal.utils.server import CondaLockFileManager
 from clim_recal.utils.xarray import (
     GLASGOW_GEOM_LOCAL_PATH,
+    NETCDF4_XARRAY_ENGINE,
     cpm_reproject_with_standard_calendar,
+    netcdf_chunk_encoding,
 )
 from tests.utils import (
     CPM_CONVERTED_TASMAX_1980_FILE,
@@ -46,12 +52,27 @@ from tests.utils import (
     xarray_example,
 )
 
+# Avoid initialising a GUI backend when tests save plots
+matplotlib.use("Agg")
+
 MOUNT_DOCTEST_SKIP_MESSAGE: Final[str] = "requires external data mounted"
 MOUNT_OR_CACHE_DOCTEST_SKIP_MESSAGE: Final[str] = (
     "requires external data mounted or cached"
 )
 
+# `open_dataset` loads variables lazily on access and, with the default
+# `cache=True`, keeps them for reuse by other tests using session fixtures
+NETCDF_READER_KWARGS: Final[dict[str, str]] = {
+    "decode_coords": "all",
+    "engine": NETCDF4_XARRAY_ENGINE,
+}
 BADGE_PATH: Final[Path] = Path("../docs") / "assets" / "coverage.svg"
+COVERAGE_DATA_PATH: Final[Path] = Path(".coverage")
+# `multiprocess` tests share cores with other `pytest-xdist` workers
+XDIST_MULTIPROCESS_CPUS: Final[int] = 2
+# Neutral so no `VariableOptions` name (e.g. `tasmax`) is in copied input paths
+SESSION_LOCAL_COPY_FOLDER_NAME: Final[str] = "local_cache"
+TEST_PLOTS_ENV_VAR: Final[str] = "CLIM_RECAL_TEST_PLOTS"
 CLIMATE_DATA_MOUNT_PATH_LINUX: Final[Path] = Path("/mnt/vmfileshare/ClimateData")
 CLIMATE_DATA_MOUNT_PATH_MACOS: Final[Path] = Path("/Volumes/vmfileshare/ClimateData")
 
@@ -122,14 +143,14 @@ def local_cache_fixtures(
                 # local_cache_path=local_cpm_cache_path / 'tasmax/01/latest' / CPM_RAW_TASMAX_1980_FILE,
                 local_cache_path=local_cpm_cache_path / CPM_RAW_TASMAX_1980_FILE,
                 reader=open_dataset,
-                reader_kwargs={"decode_coords": "all"},
+                reader_kwargs=NETCDF_READER_KWARGS,
             ),
             LocalCache(
                 name="tasmax_cpm_1980_converted",
                 source_path=CPM_RAW_TASMAX_EXAMPLE_PATH,
                 local_cache_path=local_cpm_cache_path / CPM_CONVERTED_TASMAX_1980_FILE,
                 reader=open_dataset,
-                reader_kwargs={"decode_coords": "all"},
+                reader_kwargs=NETCDF_READER_KWARGS,
                 parser=cpm_reproject_with_standard_calendar,
             ),
             LocalCache(
@@ -137,7 +158,7 @@ def local_cache_fixtures(
                 source_path=HADS_RAW_TASMAX_EXAMPLE_PATH,
                 local_cache_path=local_hads_cache_path / HADS_RAW_TASMAX_1980_FILE,
                 reader=open_dataset,
-                reader_kwargs={"decode_coords": "all"},
+                reader_kwargs=NETCDF_READER_KWARGS,
             ),
             # LocalCache(
             #     name="railfall_hads_1980_raw",
@@ -163,6 +184,27 @@ def local_cache_fixtures(
     return cache_manager
 
 
+def session_local_copy(
+    cache: LocalCache, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Copy `cache.source_path` to a session temp folder if mounted.
+
+    Avoids each test reading from a network mount. Only the one
+    `source_path` file is copied, so managers given its folder run over
+    that single file. If `source_path` is not available, `source_path`
+    is returned unchanged.
+    """
+    if not cache.source_path_exists:
+        return Path(cache.source_path)
+    session_cache: LocalCache = LocalCache(
+        name=cache.name,
+        source_path=cache.source_path,
+        local_cache_path=tmp_path_factory.mktemp(SESSION_LOCAL_COPY_FOLDER_NAME),
+    )
+    session_cache.sync()
+    return session_cache.cache_path
+
+
 @pytest.fixture(scope="session")
 def tasmax_cpm_1980_raw(
     local_cache: bool,
@@ -181,11 +223,20 @@ def tasmax_cpm_1980_raw(
 def tasmax_cpm_1980_raw_path(
     local_cache: bool,
     local_cache_fixtures: LocalCachesManager,
+    tmp_path_factory: pytest.TempPathFactory,
 ) -> T_Dataset:
     if local_cache:
         return local_cache_fixtures["tasmax_cpm_1980_raw"].local_cache_path
     else:
-        return local_cache_fixtures["tasmax_cpm_1980_raw"].source_path
+        return session_local_copy(
+            local_cache_fixtures["tasmax_cpm_1980_raw"], tmp_path_factory
+        )
+
+
+@pytest.fixture(scope="session")
+def tasmax_cpm_1980_raw_dir(tasmax_cpm_1980_raw_path: Path) -> Path:
+    """Folder of `tasmax_cpm_1980_raw_path` for `CPM` resampler inputs."""
+    return tasmax_cpm_1980_raw_path.parent
 
 
 @pytest.fixture(scope="session")
@@ -206,11 +257,26 @@ def tasmax_hads_1980_raw(
 def tasmax_hads_1980_raw_path(
     local_cache: bool,
     local_cache_fixtures: LocalCachesManager,
+    tmp_path_factory: pytest.TempPathFactory,
 ) -> T_Dataset:
     if local_cache:
         return local_cache_fixtures["tasmax_hads_1980_raw"].local_cache_path
     else:
-        return local_cache_fixtures["tasmax_hads_1980_raw"].source_path
+        return session_local_copy(
+            local_cache_fixtures["tasmax_hads_1980_raw"], tmp_path_factory
+        )
+
+
+@pytest.fixture(scope="session")
+def tasmax_hads_1980_raw_dir(tasmax_hads_1980_raw_path: Path) -> Path:
+    """Folder of `tasmax_hads_1980_raw_path` for `HADs` resampler inputs."""
+    return tasmax_hads_1980_raw_path.parent
+
+
+@pytest.fixture(scope="session")
+def tasmax_hads_1980_input_files(tasmax_hads_1980_raw_dir: Path) -> tuple[Path, ...]:
+    """`HADsResampler` `input_files` listed once rather than per config."""
+    return tuple(tasmax_hads_1980_raw_dir.glob(f"*.{NETCDF_EXTENSION_STR}"))
 
 
 @pytest.fixture(scope="session")
@@ -238,6 +304,34 @@ def tasmax_cpm_1980_converted_path(
         return local_cache_fixtures["tasmax_cpm_1980_converted"].source_path
 
 
+@pytest.fixture(scope="session")
+def tasmax_cpm_1980_projected_path(
+    tasmax_cpm_1980_raw_path: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> Path:
+    """Run `cpm_reproject_with_standard_calendar` once per session for reuse."""
+    path: Path = (
+        tmp_path_factory.mktemp("cpm-projected") / tasmax_cpm_1980_raw_path.name
+    )
+    projected: T_Dataset = cpm_reproject_with_standard_calendar(
+        tasmax_cpm_1980_raw_path
+    )
+    projected.to_netcdf(path, encoding=netcdf_chunk_encoding(projected))
+    return path
+
+
+@pytest.fixture(scope="session")
+def tasmax_cpm_1980_projected_xy(
+    tasmax_cpm_1980_projected_path: Path,
+) -> tuple[NDArray, NDArray]:
+    """Projected CPM `x` and `y` coordinates, read once per session."""
+    with open_dataset(tasmax_cpm_1980_projected_path) as projected:
+        return (
+            np.ascontiguousarray(projected.x.values),
+            np.ascontiguousarray(projected.y.values),
+        )
+
+
 # This may be removed in future
 # @pytest.fixture(autouse=True)
 def ensure_python_path() -> None:
@@ -245,19 +339,21 @@ def ensure_python_path() -> None:
     check_package_path(try_chdir=True)
 
 
-@pytest.fixture
+# `xarray_spatial_*` fixtures are shared across a test session,
+# call `.copy()` before modifying them within a test.
+@pytest.fixture(scope="session")
 def xarray_spatial_4_days() -> DataArray:
     """Generate a `xarray` spatial time series 1980-11-30 to 1980-12-05."""
     return xarray_example(end_date=XARRAY_END_DATE_4_DAYS)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def xarray_spatial_8_days() -> DataArray:
     """Generate a `xarray` spatial time series 1980-11-30 to 1980-12-10."""
     return xarray_example(end_date=XARRAY_END_DATE_8_DAYS)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def xarray_spatial_6_days_2_skipped() -> DataArray:
     """Generate a `xarray` spatial time series 1980-11-30 to 1980-12-05."""
     return xarray_example(
@@ -267,13 +363,13 @@ def xarray_spatial_6_days_2_skipped() -> DataArray:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def xarray_spatial_4_years() -> DataArray:
     """Generate a `xarray` spatial time series 1980-11-30 to 1984-11-30."""
     return xarray_example(end_date=XARRAY_EXAMPLE_END_DATE_4_YEARS)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def xarray_spatial_4_years_360_day() -> Dataset:
     """Generate a `xarray` spatial time series 1980-11-30 to 1984-11-30."""
     four_normal_years: Dataset = xarray_example(
@@ -300,8 +396,12 @@ def glasgow_shape_file_path(data_fixtures_path: Path) -> Path:
 
 @pytest.fixture(scope="session")
 def test_runs_output_path(
-    keep_test_results: bool, path=TEST_RESULTS_PATH
+    request, keep_test_results: bool, path=TEST_RESULTS_PATH
 ) -> Iterator[Path]:
+    """Return `path` for results, per worker if run via `pytest-xdist`."""
+    worker_id: str = getattr(request.config, "workerinput", {}).get("workerid", "main")
+    if worker_id != "main":
+        path = path / worker_id
     path.mkdir(exist_ok=True, parents=True)
     yield path
     if not keep_test_results:
@@ -334,6 +434,12 @@ def pytest_addoption(parser):
         default=False,
         help="Keep test result files (else deleted after each test)",
     )
+    parser.addoption(
+        "--plots",
+        action=BooleanOptionalAction,
+        default=environ.get(TEST_PLOTS_ENV_VAR) == "1",
+        help=f"Save plots in tests (default via {TEST_PLOTS_ENV_VAR}=1)",
+    )
 
 
 @pytest.fixture(scope="session")
@@ -356,6 +462,20 @@ def keep_test_results(request) -> bool:
     return request.config.getoption("--keep-results")
 
 
+@pytest.fixture(scope="session")
+def plots_enabled(request) -> bool:
+    return request.config.getoption("--plots")
+
+
+@pytest.fixture(scope="session")
+def multiprocess_cpus(request) -> int | None:
+    """Limit `multiprocess` `cpus` on `pytest-xdist` workers, else `None`."""
+    if hasattr(request.config, "workerinput"):
+        return XDIST_MULTIPROCESS_CPUS
+    else:
+        return None
+
+
 @pytest.fixture(scope="session")
 def local_test_data_path() -> Path:
     return TEST_DATA_PATH
@@ -530,11 +650,17 @@ def doctest_auto_fixtures(
 def pytest_sessionfinish(session, exitstatus):
     """Generate badges for docs after tests finish.
 
+    Badge generation is skipped if `COVERAGE_DATA_PATH` is older
+    than the current `BADGE_PATH`.
+
     Note
     ----
     This example assumes the `doctest` for `utils.csv_reader` is written in
     the `tests/` folder.
     """
+    if hasattr(session.config, "workerinput"):
+        # Only clean up and generate badges from the `pytest-xdist` controller
+        return
     test_auth_csv_paths: tuple[Path, ...] = (
         Path(TEST_AUTH_CSV_FILE_NAME),
         Path("tests") / TEST_AUTH_CSV_FILE_NAME,
@@ -543,5 +669,12 @@ def pytest_sessionfinish(session, exitstatus):
         if test_auth_path.exists():
             test_auth_path.unlink()
     if exitstatus == 0:
+        if (
+            COVERAGE_DATA_PATH.exists()
+            and BADGE_PATH.exists()
+            and BADGE_PATH.stat().st_mtime >= COVERAGE_DATA_PATH.stat().st_mtime
+        ):
+            # Coverage data unchanged since the badge was last generated
+            return
         BADGE_PATH.parent.mkdir(parents=True, exist_ok=True)
         gen_cov_badge(["-o", f"{BADGE_PATH}", "-f"])
@@ -0,0 +1,72 @@
+from timeit import repeat
+from typing import Callable, Final
+
+import pytest
+from numpy.testing import assert_allclose
+from xarray.core.types import T_DataArray, T_Dataset
+
+from clim_recal.utils.xarray import convert_xr_calendar, interpolate_xr_ts_nans
+
+# Fastest of `BENCHMARK_REPEATS` runs of `BENCHMARK_NUMBER` calls each
+BENCHMARK_REPEATS: Final[int] = 5
+BENCHMARK_NUMBER: Final[int] = 3
+
+
+def fastest_time(func: Callable[[], object]) -> float:
+    """Return fastest seconds of `BENCHMARK_REPEATS` timings of `func`."""
+    return min(repeat(func, number=BENCHMARK_NUMBER, repeat=BENCHMARK_REPEATS))
+
+
+def report_timings(
+    record_property: Callable[[str, object], None],
+    vectorized: Callable[[], object],
+    reference: Callable[[], object],
+) -> None:
+    """Record `vectorized` and `reference` timings without asserting on them.
+
+    Wall clock ratios vary on shared or loaded runners, so they are
+    only recorded (e.g. via `--junitxml`) for comparison.
+    """
+    vectorized_time: float = fastest_time(vectorized)
+    reference_time: float = fastest_time(reference)
+    record_property("vectorized_seconds", vectorized_time)
+    record_property("reference_seconds", reference_time)
+
+
+@pytest.mark.benchmark
+def test_bench_interpolate_xr_ts_nans_vectorized_linear(
+    xarray_spatial_4_years: T_DataArray,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Report `vectorized_linear` and `interpolate_na` timings."""
+    base: T_Dataset = xarray_spatial_4_years.to_dataset()
+    with_gaps: T_Dataset = base.where(~base.time.dt.day.isin((3, 4, 5, 17)))
+    kwargs: dict = dict(interpolate_method="linear", limit=2, fast_limit_1=False)
+
+    def vectorized() -> T_Dataset:
+        return interpolate_xr_ts_nans(with_gaps, vectorized_linear=True, **kwargs)
+
+    def reference() -> T_Dataset:
+        return interpolate_xr_ts_nans(with_gaps, vectorized_linear=False, **kwargs)
+
+    assert_allclose(vectorized().xa_template, reference().xa_template)
+    report_timings(record_property, vectorized, reference)
+
+
+@pytest.mark.benchmark
+def test_bench_convert_xr_calendar_vectorized_linear(
+    xarray_spatial_4_years_360_day: T_Dataset,
+    record_property: Callable[[str, object], None],
+) -> None:
+    """Report `convert_xr_calendar` `vectorized_linear` and default timings."""
+    dates_360: T_Dataset = xarray_spatial_4_years_360_day
+    kwargs: dict = dict(interpolate_na=True, interpolate_method="linear", limit=2)
+
+    def vectorized() -> T_Dataset:
+        return convert_xr_calendar(dates_360, vectorized_linear=True, **kwargs)
+
+    def reference() -> T_Dataset:
+        return convert_xr_calendar(dates_360, vectorized_linear=False, **kwargs)
+
+    assert_allclose(vectorized().day_360, reference().day_360)
+    report_timings(record_property, vectorized, reference)
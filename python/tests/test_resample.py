@@ -1,43 +1,87 @@
 from pathlib import Path
-from typing import Any, Final
+from typing import Any, Callable, Final, Iterator, TypeAlias
 
 import numpy as np
 import pytest
+from netCDF4 import Dataset as NetCDF4Dataset
 from numpy.testing import assert_allclose
 from numpy.typing import NDArray
-from xarray import open_dataset
+from pandas import date_range
+from xarray import Dataset, open_dataset, open_zarr
 from xarray.core.types import T_Dataset
 
 from clim_recal.resample import (
     CPM_CROP_OUTPUT_LOCAL_PATH,
+    CPM_OUTPUT_LOCAL_PATH,
     HADS_CROP_OUTPUT_LOCAL_PATH,
+    HADS_OUTPUT_LOCAL_PATH,
     CPMResampler,
     CPMResamplerManager,
     HADsResampler,
     HADsResamplerManager,
     ResamblerManagerBase,
 )
-from clim_recal.utils.core import CLI_DATE_FORMAT_STR
-from clim_recal.utils.data import RegionOptions, RunOptions
+from clim_recal.utils.data import (
+    BRITISH_NATIONAL_GRID_EPSG,
+    CPM_RESOLUTION_METERS,
+    RegionOptions,
+    RunOptions,
+)
+from clim_recal.utils.gdal_formats import NETCDF_EXTENSION_STR, ZARR_EXTENSION_STR
 from clim_recal.utils.xarray import (
     FINAL_CONVERTED_CPM_WIDTH,
     FINAL_RESAMPLE_LON_COL,
+    ZARR_BLOSC_CNAME,
     plot_xarray,
 )
 
 from .utils import (
+    CPM_FIRST_DATES,
     CPM_TASMAX_DAY_SERVER_PATH,
     CPM_TASMAX_LOCAL_TEST_PATH,
     FINAL_CPM_DEC_10_X_2_Y_200_210,
+    FLOAT32_RTOL,
     HADS_UK_TASMAX_DAY_SERVER_PATH,
     HADS_UK_TASMAX_LOCAL_TEST_PATH,
+    TEST_PLOT_STRIDE,
+    first_days,
+    skip_small_runner_multiprocess,
 )
 
-HADS_FIRST_DATES: Final[NDArray] = np.array(
-    ["19800101", "19800102", "19800103", "19800104", "19800105"]
+ResamplersTupleType: TypeAlias = tuple[HADsResampler | CPMResampler, ...]
+
+# `open_dataset` options for exports only probed by assertions. `first_days`
+# decodes the few `time` values compared, and `mask_and_scale` is kept so
+# `_FillValue` cells stay `nan`.
+ASSERTION_OPEN_KWARGS: Final[dict[str, bool]] = {
+    "decode_times": False,
+    "decode_coords": False,
+    "cache": False,
+}
+
+HADS_FIRST_DATES: Final[NDArray] = np.arange(
+    "1980-01-01", "1980-01-06", dtype="datetime64[D]"
+)
+HADS_FIRST_DATES.setflags(write=False)
+# `time` size, whether a `tasmax` probe has any finite value and first dates
+HADS_EXPORT_SUMMARY: Final[tuple[int, bool, tuple[np.datetime64, ...]]] = (
+    31,
+    True,
+    tuple(HADS_FIRST_DATES),
 )
 
 
+def hads_export_summary(
+    export: T_Dataset,
+) -> tuple[int, bool, tuple[np.datetime64, ...]]:
+    """Return `export` values to compare with `HADS_EXPORT_SUMMARY`."""
+    return (
+        export.sizes["time"],
+        bool(np.isfinite(export.tasmax.variable[0, 200:300].values).any()),
+        tuple(first_days(export.time)),
+    )
+
+
 @pytest.fixture
 def cpm_tasmax_raw_mount_path(data_mount_path: Path) -> Path:
     return data_mount_path / CPM_TASMAX_DAY_SERVER_PATH
@@ -58,6 +102,57 @@ def cpm_tasmax_local_test_path(data_fixtures_path: Path) -> Path:
     return data_fixtures_path / CPM_TASMAX_LOCAL_TEST_PATH
 
 
+@pytest.fixture(scope="module")
+def cpm_1980_reprojected(
+    tasmax_cpm_1980_raw_dir: Path,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> tuple[CPMResampler, Path]:
+    """Reproject the first `CPM` file once via `range_to_reprojection`."""
+    resampler = CPMResampler(
+        input_path=tasmax_cpm_1980_raw_dir,
+        output_path=tmp_path_factory.mktemp("cpm-reproj"),
+    )
+    paths: list[Path] = resampler.range_to_reprojection(stop=1)
+    assert len(paths) == 1
+    return resampler, paths[0]
+
+
+@pytest.fixture(scope="module")
+def cpm_1980_reprojected_export(
+    cpm_1980_reprojected: tuple[CPMResampler, Path],
+) -> Iterator[T_Dataset]:
+    """Open `cpm_1980_reprojected` once for `CPM` export checks."""
+    with open_dataset(cpm_1980_reprojected[1], **ASSERTION_OPEN_KWARGS) as export:
+        yield export
+
+
+@pytest.mark.localcache
+@pytest.mark.slow
+@pytest.mark.mount
+def test_cpm_reprojection_export(
+    resample_test_cpm_output_path,
+    cpm_1980_reprojected_export: T_Dataset,
+    plots_enabled: bool,
+) -> None:
+    """Test an unpatched `range_to_reprojection` default CPM calendar fix."""
+    export: T_Dataset = cpm_1980_reprojected_export
+    assert export.sizes["time"] == 365
+    assert export.sizes[FINAL_RESAMPLE_LON_COL] == FINAL_CONVERTED_CPM_WIDTH
+    assert_allclose(
+        export.tasmax.variable[10, 5, :10].values,
+        FINAL_CPM_DEC_10_X_2_Y_200_210,
+        rtol=FLOAT32_RTOL,
+    )
+    assert np.array_equal(CPM_FIRST_DATES, first_days(export.time))
+    if plots_enabled:
+        plot_xarray(
+            export.tasmax[0],
+            path=resample_test_cpm_output_path / "config-range.png",
+            time_stamp=True,
+            stride=TEST_PLOT_STRIDE,
+        )
+
+
 @pytest.mark.localcache
 @pytest.mark.slow
 @pytest.mark.mount
@@ -65,74 +160,91 @@ def cpm_tasmax_local_test_path(data_fixtures_path: Path) -> Path:
     "config", ("direct", "range", "direct_provided", "range_provided")
 )
 def test_cpm_manager(
-    resample_test_cpm_output_path, config: str, tasmax_cpm_1980_raw_path: Path
+    resample_test_cpm_output_path,
+    config: str,
+    cpm_1980_reprojected: tuple[CPMResampler, Path],
+    monkeypatch: pytest.MonkeyPatch,
 ) -> None:
-    """Test running default CPM calendar fix."""
-    CPM_FIRST_DATES: np.array = np.array(
-        ["19801201", "19801202", "19801203", "19801204", "19801205"]
-    )
-    output_path: Path = resample_test_cpm_output_path / config
+    """Test each `config` dispatches the first `CPM` file to `apply_geo_func`.
+
+    `apply_geo_func` is patched to return the path reprojected once in
+    `cpm_1980_reprojected`, whose values `test_cpm_reprojection_export`
+    checks.
+    """
+    reprojected_config, reprojected_path = cpm_1980_reprojected
+    # Reuse the module `input_files` listing rather than glob again
     test_config = CPMResampler(
-        input_path=tasmax_cpm_1980_raw_path.parent,
-        output_path=output_path,
+        input_path=reprojected_config.input_path,
+        input_files=reprojected_config.input_files,
+        output_path=resample_test_cpm_output_path / config,
     )
-    paths: list[Path]
-    match config:
-        case "direct":
-            paths = [test_config.to_reprojection()]
-        case "range":
-            paths = test_config.range_to_reprojection(stop=1)
-        case "direct_provided":
-            paths = [
-                test_config.to_reprojection(index=0, source_to_index=tuple(test_config))
-            ]
-        case "range_provided":
-            paths = test_config.range_to_reprojection(
-                stop=1, source_to_index=tuple(test_config)
-            )
-    export: T_Dataset = open_dataset(paths[0])
-    assert export.dims["time"] == 365
-    assert export.dims[FINAL_RESAMPLE_LON_COL] == FINAL_CONVERTED_CPM_WIDTH
-    assert_allclose(export.tasmax[10][5][:10].values, FINAL_CPM_DEC_10_X_2_Y_200_210)
-    assert (
-        CPM_FIRST_DATES == export.time.dt.strftime(CLI_DATE_FORMAT_STR).head().values
-    ).all()
-    plot_xarray(
-        export.tasmax[0],
-        path=resample_test_cpm_output_path / f"config-{config}.png",
-        time_stamp=True,
+    source_paths: list[Path] = []
+
+    def reprojected(source_path: Path, **kwargs) -> Path:
+        source_paths.append(source_path)
+        return reprojected_path
+
+    monkeypatch.setattr("clim_recal.resample.apply_geo_func", reprojected)
+    sources: tuple[Path, ...] | None = (
+        tuple(reprojected_config) if "provided" in config else None
     )
+    config_calls: dict[str, Callable[[], list[Path]]] = {
+        "direct": lambda: [test_config.to_reprojection()],
+        "range": lambda: test_config.range_to_reprojection(stop=1),
+        "direct_provided": lambda: [
+            test_config.to_reprojection(index=0, source_to_index=sources)
+        ],
+        "range_provided": lambda: test_config.range_to_reprojection(
+            stop=1, source_to_index=sources
+        ),
+    }
+    paths: list[Path] = config_calls[config]()
+    assert paths == [reprojected_path]
+    assert source_paths == [reprojected_config[0]]
 
 
 @pytest.mark.localcache
 @pytest.mark.slow
 @pytest.mark.mount
-@pytest.mark.parametrize("range", (False, True))
+@pytest.mark.parametrize(
+    "range, multiprocess",
+    (
+        (False, False),
+        (True, False),
+        pytest.param(True, True, marks=skip_small_runner_multiprocess),
+    ),
+)
 def test_hads_manager(
-    resample_test_hads_output_path, range: bool, tasmax_hads_1980_raw_path: Path
+    resample_test_hads_output_path,
+    range: bool,
+    multiprocess: bool,
+    tasmax_hads_1980_raw_dir: Path,
+    plots_enabled: bool,
+    multiprocess_cpus: int | None,
 ) -> None:
     """Test running default HADs spatial projection."""
     test_config = HADsResampler(
-        input_path=tasmax_hads_1980_raw_path.parent,
-        output_path=resample_test_hads_output_path / f"range-{range}",
+        input_path=tasmax_hads_1980_raw_dir,
+        output_path=resample_test_hads_output_path
+        / f"range-{range}-multi-{multiprocess}",
     )
     paths: list[Path]
     if range:
-        paths = test_config.range_to_reprojection(stop=1)
+        paths = test_config.range_to_reprojection(
+            stop=1, multiprocess=multiprocess, cpus=multiprocess_cpus
+        )
     else:
         paths = [test_config.to_reprojection()]
-    export: T_Dataset = open_dataset(paths[0])
-    assert len(export.time) == 31
-    assert not np.isnan(export.tasmax[0][200:300].values).all()
-    assert (
-        HADS_FIRST_DATES.astype(object)
-        == export.time.dt.strftime(CLI_DATE_FORMAT_STR).head().values
-    ).all()
-    plot_xarray(
-        export.tasmax[0],
-        path=resample_test_hads_output_path / f"range-{range}.png",
-        time_stamp=True,
-    )
+    with open_dataset(paths[0], **ASSERTION_OPEN_KWARGS) as export:
+        assert hads_export_summary(export) == HADS_EXPORT_SUMMARY
+        if plots_enabled:
+            plot_xarray(
+                export.tasmax[0],
+                path=resample_test_hads_output_path
+                / f"range-{range}-multi-{multiprocess}.png",
+                time_stamp=True,
+                stride=TEST_PLOT_STRIDE,
+            )
 
 
 @pytest.mark.localcache
@@ -159,94 +271,174 @@ def test_variable_in_base_import_path_error(
             )
 
 
-@pytest.mark.localcache
-@pytest.mark.slow
-@pytest.mark.mount
-@pytest.mark.parametrize("multiprocess", (False, True))
-def test_execute_resample_configs(
-    multiprocess: bool, tmp_path, tasmax_hads_1980_raw_path: Path
-) -> None:
-    """Test running default HADs spatial projection."""
+@pytest.fixture(
+    scope="module",
+    params=(False, pytest.param(True, marks=skip_small_runner_multiprocess)),
+    ids=("serial", "multiprocess"),
+)
+def hads_resample_configs_export(
+    request: pytest.FixtureRequest,
+    tasmax_hads_1980_raw_dir: Path,
+    tasmax_hads_1980_input_files: tuple[Path, ...],
+    tmp_path_factory: pytest.TempPathFactory,
+    multiprocess_cpus: int | None,
+) -> Iterator[T_Dataset]:
+    """Run `execute_resample_configs` once per `multiprocess` option."""
+    output_path: Path = tmp_path_factory.mktemp("hads-resample-configs")
     test_config = HADsResamplerManager(
-        input_paths=tasmax_hads_1980_raw_path.parent,
-        resample_paths=tmp_path,
-        crop_paths=tmp_path,
+        input_paths=tasmax_hads_1980_raw_dir,
+        resample_paths=output_path,
+        crop_paths=output_path,
         stop_index=1,
+        config_default_kwargs={"input_files": tasmax_hads_1980_input_files},
     )
-    resamplers: tuple[HADsResampler | CPMResampler, ...] = (
-        test_config.execute_resample_configs(multiprocess=multiprocess)
+    resamplers: ResamplersTupleType = test_config.execute_resample_configs(
+        multiprocess=request.param, cpus=multiprocess_cpus
     )
-    export: T_Dataset = open_dataset(resamplers[0][0])
-    assert len(export.time) == 31
-    assert not np.isnan(export.tasmax[0][200:300].values).all()
-    assert (
-        HADS_FIRST_DATES.astype(object)
-        == export.time.dt.strftime(CLI_DATE_FORMAT_STR).head().values
-    ).all()
+    with open_dataset(resamplers[0][0], **ASSERTION_OPEN_KWARGS) as export:
+        yield export
 
 
 @pytest.mark.localcache
 @pytest.mark.slow
 @pytest.mark.mount
-@pytest.mark.parametrize("manager", (CPMResamplerManager, HADsResamplerManager))
-# @pytest.mark.parametrize("multiprocess", (False, True))
-def test_execute_crop_configs(
-    manager: ResamblerManagerBase,
-    # multiprocess: bool,
-    tmp_path: Path,
-    resample_test_hads_output_path: Path,
-    resample_test_cpm_output_path: Path,
-    tasmax_hads_1980_raw_path: Path,
-    tasmax_cpm_1980_raw_path: Path,
-    tasmax_cpm_1980_converted_path: Path,
-) -> None:
+def test_execute_resample_configs(hads_resample_configs_export: T_Dataset) -> None:
     """Test running default HADs spatial projection."""
-    multiprocess: bool = False
+    export: T_Dataset = hads_resample_configs_export
+    assert hads_export_summary(export) == HADS_EXPORT_SUMMARY
+
+
+@pytest.fixture(
+    scope="module",
+    params=(CPMResamplerManager, HADsResamplerManager),
+    ids=("cpm", "hads"),
+)
+def resampled_crop_manager(
+    request: pytest.FixtureRequest,
+    tmp_path_factory: pytest.TempPathFactory,
+    test_runs_output_path: Path,
+    tasmax_hads_1980_raw_dir: Path,
+    tasmax_cpm_1980_raw_dir: Path,
+    tasmax_cpm_1980_converted_path: Path,
+) -> ResamblerManagerBase:
+    """Run `execute_resample_configs` once per manager for crop tests."""
+    manager: type[ResamblerManagerBase] = request.param
     input_path: Path
     crop_path: Path
     manager_kwargs: dict[str, Any] = {}
     if manager is HADsResamplerManager:
-        input_path = tasmax_hads_1980_raw_path.parent
+        input_path = tasmax_hads_1980_raw_dir
         crop_path = (
-            resample_test_hads_output_path / "manage" / HADS_CROP_OUTPUT_LOCAL_PATH
+            test_runs_output_path
+            / HADS_OUTPUT_LOCAL_PATH
+            / "manage"
+            / HADS_CROP_OUTPUT_LOCAL_PATH
         )
         manager_kwargs["cpm_for_coord_alignment"] = tasmax_cpm_1980_converted_path
         manager_kwargs["cpm_for_coord_alignment_path_converted"] = True
     else:
-        input_path = tasmax_cpm_1980_raw_path.parent
+        input_path = tasmax_cpm_1980_raw_dir
         crop_path = (
-            resample_test_cpm_output_path / "manage" / CPM_CROP_OUTPUT_LOCAL_PATH
+            test_runs_output_path
+            / CPM_OUTPUT_LOCAL_PATH
+            / "manage"
+            / CPM_CROP_OUTPUT_LOCAL_PATH
         )
         manager_kwargs["runs"] = (RunOptions.ONE,)
     test_config: ResamblerManagerBase = manager(
         input_paths=input_path,
-        resample_paths=tmp_path,
+        resample_paths=tmp_path_factory.mktemp("crop-resample"),
         crop_paths=crop_path,
         stop_index=1,
         _strict_fail_if_var_in_input_path=False,
         **manager_kwargs,
     )
     if isinstance(test_config, HADsResamplerManager):
-        test_config.set_cpm_for_coord_alignment = tasmax_cpm_1980_converted_path
+        # Load the alignment grid once for all `HADsResampler` configs
+        test_config.set_cpm_for_coord_alignment()
+    _: ResamplersTupleType = test_config.execute_resample_configs()
+    return test_config
 
-    _: tuple[HADsResampler | CPMResampler, ...] = test_config.execute_resample_configs(
-        multiprocess=multiprocess
-    )
-    region_crops: tuple[HADsResampler | CPMResampler, ...] = (
-        test_config.execute_crop_configs(multiprocess=multiprocess)
+
+@pytest.mark.localcache
+@pytest.mark.slow
+@pytest.mark.mount
+@pytest.mark.parametrize(
+    "multiprocess",
+    (False, pytest.param(True, marks=skip_small_runner_multiprocess)),
+)
+def test_execute_crop_configs(
+    resampled_crop_manager: ResamblerManagerBase,
+    multiprocess: bool,
+    multiprocess_cpus: int | None,
+) -> None:
+    """Test running default HADs spatial projection."""
+    test_config: ResamblerManagerBase = resampled_crop_manager
+    region_crops: ResamplersTupleType = test_config.execute_crop_configs(
+        multiprocess=multiprocess, cpus=multiprocess_cpus
     )
-    region_crop_dict: dict[str, tuple[Path, ...]] = {
-        crop.crop_region: tuple(Path(crop.crop_path).iterdir()) for crop in region_crops
+    region_crop_dict: dict[str, Path] = {
+        crop.crop_region: next(Path(crop.crop_path).glob(f"*.{NETCDF_EXTENSION_STR}"))
+        for crop in region_crops
     }
     assert len(region_crop_dict) == len(region_crops) == len(RegionOptions)
+    expected_time_length: int = (
+        31 if isinstance(test_config, HADsResamplerManager) else 365
+    )
     for region, path in region_crop_dict.items():
-        cropped_region: T_Dataset = open_dataset(path[0])
+        # Only `x` and `y` extents and `time` size are checked, so read them
+        # via `netCDF4`; monotonic coords have their extents at either end
+        with NetCDF4Dataset(path) as cropped_region:
+            x: NDArray = cropped_region["x"][[0, -1]]
+            y: NDArray = cropped_region["y"][[0, -1]]
+            time_length: int = cropped_region.dimensions["time"].size
         bbox = RegionOptions.bounding_box(region)
-        assert_allclose(cropped_region["x"].max(), bbox.xmax, rtol=0.1)
-        assert_allclose(cropped_region["x"].min(), bbox.xmin, rtol=0.1)
-        assert_allclose(cropped_region["y"].max(), bbox.ymax, rtol=0.1)
-        assert_allclose(cropped_region["y"].min(), bbox.ymin, rtol=0.1)
-        if isinstance(test_config, HADsResamplerManager):
-            assert len(cropped_region["time"]) == 31
-        else:
-            assert len(cropped_region["time"]) == 365
+        assert_allclose(
+            (x.max(), x.min(), y.max(), y.min()),
+            (bbox.xmax, bbox.xmin, bbox.ymax, bbox.ymin),
+            rtol=0.1,
+        )
+        assert time_length == expected_time_length
+
+
+def test_crop_projection_to_zarr(tmp_path: Path) -> None:
+    """Test `crop_to_zarr` writes a consolidated, cropped `zarr` store."""
+    pytest.importorskip("zarr")
+    bbox = RegionOptions.bounding_box(RegionOptions.GLASGOW)
+    # A 2.2km grid extending 5 cells beyond the `Glasgow` bounding box
+    margin: int = 5 * CPM_RESOLUTION_METERS
+    resampled: T_Dataset = Dataset(
+        coords={
+            "time": date_range("1980-12-01", periods=3),
+            "y": np.arange(
+                bbox.ymax + margin, bbox.ymin - margin, -CPM_RESOLUTION_METERS
+            ),
+            "x": np.arange(
+                bbox.xmin - margin, bbox.xmax + margin, CPM_RESOLUTION_METERS
+            ),
+        }
+    )
+    resampled["tasmax"] = (
+        ("time", "y", "x"),
+        np.random.default_rng(0).random(tuple(resampled.sizes.values())),
+    )
+    resampled_path: Path = tmp_path / "tasmax.nc"
+    resampled.rio.write_crs(BRITISH_NATIONAL_GRID_EPSG).to_netcdf(resampled_path)
+    resampler: CPMResampler = CPMResampler(
+        input_files=(resampled_path,),
+        output_path=tmp_path / "resample",
+        crop_path=tmp_path / "crop",
+        crop_region=RegionOptions.GLASGOW,
+        crop_to_zarr=True,
+    )
+    resampler._reprojected_paths = [resampled_path]
+    zarr_path: Path = resampler.crop_projection()
+    assert zarr_path.suffix == f".{ZARR_EXTENSION_STR}"
+    with open_zarr(zarr_path, consolidated=True) as cropped:
+        assert cropped.tasmax.encoding["compressor"].cname == ZARR_BLOSC_CNAME
+        assert cropped.sizes["time"] == 3
+        assert_allclose(
+            (cropped.x.max(), cropped.x.min(), cropped.y.max(), cropped.y.min()),
+            (bbox.xmax, bbox.xmin, bbox.ymax, bbox.ymin),
+            rtol=0.1,
+        )
@@ -1,14 +1,14 @@
 import logging
-from datetime import date
+from functools import lru_cache
 from pathlib import Path
-from typing import Final
+from typing import Final, Iterator
 
 import numpy as np
 import pytest
 from numpy.testing import assert_allclose
 from numpy.typing import NDArray
 from osgeo.gdal import Dataset as GDALDataset
-from xarray import Dataset, open_dataset
+from xarray import Dataset, open_dataset, open_zarr
 from xarray.core.types import T_DataArray, T_Dataset
 
 from clim_recal.resample import (
@@ -17,18 +17,13 @@ from clim_recal.resample import (
     CPMResampler,
     HADsResampler,
 )
-from clim_recal.utils.core import (
-    CLI_DATE_FORMAT_STR,
-    DateType,
-    date_range_generator,
-    results_path,
-)
+from clim_recal.utils.core import DateType, date_range_array, results_path
 from clim_recal.utils.data import (
     BRITISH_NATIONAL_GRID_EPSG,
     HadUKGrid,
     UKCPLocalProjections,
 )
-from clim_recal.utils.gdal_formats import NETCDF_EXTENSION_STR
+from clim_recal.utils.gdal_formats import ZARR_EXTENSION_STR
 from clim_recal.utils.xarray import (
     FINAL_CONVERTED_CPM_HEIGHT,
     FINAL_CONVERTED_CPM_WIDTH,
@@ -37,20 +32,26 @@ from clim_recal.utils.xarray import (
     HADS_RAW_X_COLUMN_NAME,
     HADS_RAW_Y_COLUMN_NAME,
     NETCDF4_XARRAY_ENGINE,
+    ZARR_BLOSC_CNAME,
     ConvertCalendarAlignOptions,
+    apply_geo_func,
     convert_xr_calendar,
     cpm_check_converted,
-    cpm_reproject_with_standard_calendar,
     cpm_xarray_to_standard_calendar,
     file_name_to_start_end_dates,
     get_cpm_for_coord_alignment,
     hads_resample_and_reproject,
+    interpolate_xr_ts_nans,
+    netcdf_chunk_encoding,
     plot_xarray,
 )
 
 from .utils import (
-    CPM_RAW_TASMAX_EXAMPLE_PATH,
+    CPM_FIRST_DATES,
     FINAL_CPM_DEC_10_X_2_Y_200_210,
+    FLOAT32_RTOL,
+    TEST_PLOT_STRIDE,
+    first_days,
     xarray_example,
     year_days_count,
 )
@@ -64,6 +65,8 @@ PROJECTED_CPM_TASMAX_1980_FIRST_5: Final[NDArray] = np.array(
 PROJECTED_CPM_TASMAX_1980_DEC_31_FIRST_5: Final[NDArray] = np.array(
     [10.645899, 10.508448, 10.546778, 10.547998, 10.553614], dtype="float32"
 )
+PROJECTED_CPM_TASMAX_1980_FIRST_5.setflags(write=False)
+PROJECTED_CPM_TASMAX_1980_DEC_31_FIRST_5.setflags(write=False)
 
 FINAL_HADS_JAN_10_430_X_200_210_Y: Final[NDArray] = np.array(
     (
@@ -77,8 +80,27 @@ FINAL_HADS_JAN_10_430_X_200_210_Y: Final[NDArray] = np.array(
         7.27587694,
         7.07294578,
         7.04533059,
-    )
+    ),
+    dtype="float64",
 )
+FINAL_HADS_JAN_10_430_X_200_210_Y.setflags(write=False)
+
+
+@lru_cache(maxsize=8)
+def _cached_open(path_str: str) -> T_Dataset:
+    """Return a loaded `Dataset` from `path_str`, decoded once per module.
+
+    Callers must not modify the returned `Dataset` in place.
+    """
+    return open_dataset(
+        path_str, decode_coords="all", engine=NETCDF4_XARRAY_ENGINE
+    ).load()
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _clear_cached_open() -> Iterator[None]:
+    yield
+    _cached_open.cache_clear()
 
 
 @pytest.mark.localcache
@@ -176,14 +198,14 @@ def test_get_cpm_for_coord_alignment(
         ) in log_tuples[0][2]
     if skip_reproject and not is_converted:
         assert isinstance(converter_dataset, Dataset)
-        assert converter_dataset.dims["time"] == 360
+        assert converter_dataset.sizes["time"] == 360
         assert "x" not in converter_dataset.dims
         assert "y" not in converter_dataset.dims
     else:
         assert isinstance(converter_dataset, Dataset)
-        assert converter_dataset.dims["time"] == 365
-        assert converter_dataset.dims["x"] == FINAL_CONVERTED_CPM_WIDTH
-        assert converter_dataset.dims["y"] == FINAL_CONVERTED_CPM_HEIGHT
+        assert converter_dataset.sizes["time"] == 365
+        assert converter_dataset.sizes["x"] == FINAL_CONVERTED_CPM_WIDTH
+        assert converter_dataset.sizes["y"] == FINAL_CONVERTED_CPM_HEIGHT
 
 
 @pytest.mark.slow
@@ -191,48 +213,55 @@ def test_get_cpm_for_coord_alignment(
 @pytest.mark.mount
 def test_hads_resample_and_reproject(
     tasmax_hads_1980_raw: T_Dataset,
-    tasmax_cpm_1980_raw: T_Dataset,
+    tasmax_cpm_1980_projected_path: Path,
+    tasmax_cpm_1980_projected_xy: tuple[NDArray, NDArray],
+    plots_enabled: bool,
 ) -> None:
     variable_name: str = "tasmax"
     output_path: Path = Path("tests/runs/reample-hads")
     # First index is for month, in this case January 1980
-    # The following could be replaced by a cached fixture
-    cpm_to_match: T_Dataset = cpm_reproject_with_standard_calendar(tasmax_cpm_1980_raw)
-    plot_xarray(
-        tasmax_hads_1980_raw.tasmax[0],
-        path=output_path / "tasmas-1980-JAN-1-raw.png",
-        time_stamp=True,
-    )
+    cpm_to_match: T_Dataset = _cached_open(str(tasmax_cpm_1980_projected_path))
+    if plots_enabled:
+        plot_xarray(
+            tasmax_hads_1980_raw.tasmax[0],
+            path=output_path / "tasmas-1980-JAN-1-raw.png",
+            time_stamp=True,
+            stride=TEST_PLOT_STRIDE,
+        )
 
-    assert tasmax_hads_1980_raw.dims["time"] == 31
-    assert tasmax_hads_1980_raw.dims[HADS_RAW_X_COLUMN_NAME] == 900
-    assert tasmax_hads_1980_raw.dims[HADS_RAW_Y_COLUMN_NAME] == 1450
+    assert tasmax_hads_1980_raw.sizes["time"] == 31
+    assert tasmax_hads_1980_raw.sizes[HADS_RAW_X_COLUMN_NAME] == 900
+    assert tasmax_hads_1980_raw.sizes[HADS_RAW_Y_COLUMN_NAME] == 1450
     reprojected: T_Dataset = hads_resample_and_reproject(
         tasmax_hads_1980_raw,
         variable_name=variable_name,
-        cpm_to_match=tasmax_cpm_1980_raw,
+        cpm_to_match=cpm_to_match,
     )
 
     assert reprojected.rio.crs.to_epsg() == int(BRITISH_NATIONAL_GRID_EPSG[5:])
     export_netcdf_path: Path = results_path(
         "tasmax-1980-converted", path=output_path, extension="nc"
     )
-    reprojected.to_netcdf(export_netcdf_path)
-    read_from_export: T_Dataset = open_dataset(export_netcdf_path, decode_coords="all")
-    plot_xarray(
-        read_from_export.tasmax[0],
-        path=output_path / "tasmax-1980-JAN-1-resampled.png",
-        time_stamp=True,
+    reprojected.to_netcdf(
+        export_netcdf_path, encoding=netcdf_chunk_encoding(reprojected)
     )
+    read_from_export: T_Dataset = open_dataset(export_netcdf_path, decode_coords="all")
+    if plots_enabled:
+        plot_xarray(
+            read_from_export.tasmax[0],
+            path=output_path / "tasmax-1980-JAN-1-resampled.png",
+            time_stamp=True,
+            stride=TEST_PLOT_STRIDE,
+        )
     assert_allclose(
-        read_from_export.tasmax[10][430][200:210], FINAL_HADS_JAN_10_430_X_200_210_Y
+        read_from_export.tasmax[10, 430, 200:210], FINAL_HADS_JAN_10_430_X_200_210_Y
     )
-    assert read_from_export.dims["time"] == 31
+    assert read_from_export.sizes["time"] == 31
     assert (
-        read_from_export.dims[FINAL_RESAMPLE_LON_COL] == FINAL_CONVERTED_CPM_WIDTH
+        read_from_export.sizes[FINAL_RESAMPLE_LON_COL] == FINAL_CONVERTED_CPM_WIDTH
     )  # replaces projection_x_coordinate
     assert (
-        read_from_export.dims[FINAL_RESAMPLE_LAT_COL] == FINAL_CONVERTED_CPM_HEIGHT
+        read_from_export.sizes[FINAL_RESAMPLE_LAT_COL] == FINAL_CONVERTED_CPM_HEIGHT
     )  # replaces projection_y_coordinate
     assert reprojected.rio.crs == read_from_export.rio.crs == BRITISH_NATIONAL_GRID_EPSG
     # Check projection coordinates match for CPM and HADs
@@ -242,8 +271,9 @@ def test_hads_resample_and_reproject(
         == BRITISH_NATIONAL_GRID_EPSG
     )
     # Check projection coordinates are set at the variable level
-    assert all(cpm_to_match.x == read_from_export.x)
-    assert all(cpm_to_match.y == read_from_export.y)
+    cpm_x, cpm_y = tasmax_cpm_1980_projected_xy
+    assert np.array_equal(cpm_x, read_from_export.x.values)
+    assert np.array_equal(cpm_y, read_from_export.y.values)
     assert (
         read_from_export.spatial_ref.attrs["spatial_ref"]
         == cpm_to_match.spatial_ref.attrs["spatial_ref"]
@@ -253,7 +283,9 @@ def test_hads_resample_and_reproject(
 @pytest.mark.slow
 @pytest.mark.mount
 @pytest.mark.parametrize("interpolate_na", (True, False))
-def test_convert_cpm_calendar(interpolate_na: bool) -> None:
+def test_convert_cpm_calendar(
+    interpolate_na: bool, tasmax_cpm_1980_raw_path: Path
+) -> None:
     """Test `convert_calendar` on mounted `cpm` data.
 
     Notes
@@ -262,16 +294,14 @@ def test_convert_cpm_calendar(interpolate_na: bool) -> None:
     creating the `na_values` `bool` as the inverse of `interpolate_na`.
     """
     any_na_values_in_tasmax: bool = not interpolate_na
-    raw_nc: T_Dataset = open_dataset(
-        CPM_RAW_TASMAX_EXAMPLE_PATH, decode_coords="all", engine=NETCDF4_XARRAY_ENGINE
-    )
+    raw_nc: T_Dataset = _cached_open(str(tasmax_cpm_1980_raw_path))
     assert len(raw_nc.time) == 360
     assert len(raw_nc.time_bnds) == 360
     converted: T_Dataset = convert_xr_calendar(raw_nc, interpolate_na=interpolate_na)
     assert len(converted.time) == 365
     assert len(converted.time_bnds) == 365
     assert (
-        np.isnan(converted.tasmax.head()[0][0][0].values).all()
+        bool(np.isnan(converted.tasmax.variable[0, 0, 0].values))
         == any_na_values_in_tasmax
     )
 
@@ -303,57 +333,52 @@ def test_cpm_xarray_to_standard_calendar(
     assert test_converted.tasmax.rio.crs.to_proj4() == CORRECT_PROJ4
     assert len(test_converted.time) == 365
 
+    # Materialise `tasmax` once, then check sizes via `shape` not views
+    tasmax_data: NDArray = test_converted.tasmax.data
     tasmax_data_subset: NDArray
     if include_bnds_index:
-        assert len(test_converted.tasmax.data) == 2  # second band
-        assert len(test_converted.tasmax.data[0][0]) == 365  # first band
-        assert len(test_converted.tasmax.data[1][0]) == 365  # second band
-        tasmax_data_subset = test_converted.tasmax.data[0][0]  # first band
+        assert tasmax_data.shape[0] == 2  # second band
+        assert tasmax_data.shape[2] == 365  # days in both bands
+        tasmax_data_subset = tasmax_data[0, 0]  # first band
     else:
-        assert len(test_converted.tasmax.data) == 1  # no band index
-        tasmax_data_subset = test_converted.tasmax.data[0]
+        assert tasmax_data.shape[0] == 1  # no band index
+        tasmax_data_subset = tasmax_data[0]
     assert len(tasmax_data_subset) == 365
 
     # By default December 1 in a 360 to 365 projection would
     # be null. The values matching below should indicate the
     # projection has interpolated null values on the first date
-    assert (
-        tasmax_data_subset[0][0][:5]
-        == PROJECTED_CPM_TASMAX_1980_FIRST_5
-        # test_converted.tasmax.data[0][0][0][0][:5] == PROJECTED_CPM_TASMAX_1980_FIRST_5
-    ).all()
+    assert np.array_equal(
+        tasmax_data_subset[0, 0, :5],
+        PROJECTED_CPM_TASMAX_1980_FIRST_5,
+        # test_converted.tasmax.data[0, 0, 0, 0, :5] == PROJECTED_CPM_TASMAX_1980_FIRST_5
+    )
     # Check December 31 1980, which wouldn't be included in 360 day calendar
-    assert (
-        # test_converted.tasmax.data[0][0][31][0][:5]
-        tasmax_data_subset[31][0][:5]
-        == PROJECTED_CPM_TASMAX_1980_DEC_31_FIRST_5
-    ).all()
+    assert np.array_equal(
+        # test_converted.tasmax.data[0, 0, 31, 0, :5]
+        tasmax_data_subset[31, 0, :5],
+        PROJECTED_CPM_TASMAX_1980_DEC_31_FIRST_5,
+    )
 
 
 @pytest.mark.localcache
 @pytest.mark.mount
 @pytest.mark.slow
 def test_cpm_reproject_with_standard_calendar(
-    tasmax_cpm_1980_raw_path: Path,
+    tasmax_cpm_1980_projected_path: Path,
     test_runs_output_path: Path,
+    plots_enabled: bool,
     variable_name: str = "tasmax",
 ) -> None:
     """Test all steps around calendar and warping CPM RAW data."""
-    output_path: Path = results_path(
+    plot_path: Path = results_path(
         "test-cpm-warp",
         path=test_runs_output_path,
         mkdir=True,
-        extension=NETCDF_EXTENSION_STR,
+        extension="png",
     )
-    plot_path: Path = output_path.parent / (output_path.stem + ".png")
-    projected: T_Dataset = cpm_reproject_with_standard_calendar(
-        tasmax_cpm_1980_raw_path,
-    )
-    assert projected.rio.crs == BRITISH_NATIONAL_GRID_EPSG
-    projected.to_netcdf(output_path)
-    results: T_Dataset = open_dataset(output_path, decode_coords="all")
-    assert (results.time == projected.time).all()
-    assert results.dims == {
+    results: T_Dataset = _cached_open(str(tasmax_cpm_1980_projected_path))
+    assert results.sizes == {
         FINAL_RESAMPLE_LON_COL: FINAL_CONVERTED_CPM_WIDTH,
         FINAL_RESAMPLE_LAT_COL: FINAL_CONVERTED_CPM_HEIGHT,
         "time": 365,
@@ -361,19 +386,22 @@ def test_cpm_reproject_with_standard_calendar(
     assert results.rio.crs == BRITISH_NATIONAL_GRID_EPSG
     assert len(results.data_vars) == 1
     assert_allclose(
-        results[variable_name][10][2][200:210], FINAL_CPM_DEC_10_X_2_Y_200_210
+        results[variable_name].variable[10, 2, 200:210].values,
+        FINAL_CPM_DEC_10_X_2_Y_200_210,
+        rtol=FLOAT32_RTOL,
     )
-    plot_xarray(results.tasmax[0], plot_path, time_stamp=True)
+    if plots_enabled:
+        plot_xarray(
+            results.tasmax[0], plot_path, time_stamp=True, stride=TEST_PLOT_STRIDE
+        )
 
 
 @pytest.mark.xfail(reason="test not complete")
 def test_cpm_tif_to_standard_calendar(
     glasgow_example_cropped_cpm_rainfall_path: Path,
 ) -> None:
-    test_converted: tuple[date, ...] = tuple(
-        date_range_generator(
-            *file_name_to_start_end_dates(glasgow_example_cropped_cpm_rainfall_path)
-        )
+    test_converted: NDArray = date_range_array(
+        *file_name_to_start_end_dates(glasgow_example_cropped_cpm_rainfall_path)
     )
     assert len(test_converted) == 366
     assert False
@@ -391,18 +419,16 @@ def test_cpm_tif_to_standard_calendar(
     ("direct", "range"),
 )
 def test_crop_xarray(
-    tasmax_cpm_1980_raw_path,
-    tasmax_hads_1980_raw_path,
+    tasmax_cpm_1980_raw_dir,
+    tasmax_hads_1980_raw_dir,
     resample_test_cpm_output_path,
     resample_test_hads_output_path,
     config: str,
     data_type: str,
     region: str,
+    plots_enabled: bool,
 ):
     """Test `cropping` `DataArray` to `standard` calendar."""
-    CPM_FIRST_DATES: np.array = np.array(
-        ["19801201", "19801202", "19801203", "19801204", "19801205"]
-    )
     test_config: CPMResampler | HADsResampler
     if data_type == HadUKGrid:
         output_path: Path = resample_test_hads_output_path / config
@@ -411,7 +437,7 @@ def test_crop_xarray(
         )
 
         test_config = HADsResampler(
-            input_path=tasmax_hads_1980_raw_path.parent,
+            input_path=tasmax_hads_1980_raw_dir,
             output_path=output_path,
             crop_path=crop_path,
         )
@@ -422,7 +448,7 @@ def test_crop_xarray(
             resample_test_cpm_output_path / config / CPM_CROP_OUTPUT_LOCAL_PATH
         )
         test_config = CPMResampler(
-            input_path=tasmax_cpm_1980_raw_path.parent,
+            input_path=tasmax_cpm_1980_raw_dir,
             output_path=output_path,
             crop_path=crop_path,
         )
@@ -445,19 +471,19 @@ def test_crop_xarray(
         #     paths = test_config.range_to_reprojection(
         #         stop=1, source_to_index=tuple(test_config)
         #     )
-    crop: T_Dataset = open_dataset(paths[0])
-    # assert crop.dims[FINAL_RESAMPLE_LON_COL] == FINAL_CONVERTED_CPM_WIDTH
-    # assert_allclose(export.tasmax[10][5][:10].values, FINAL_CPM_DEC_10_5_X_0_10_Y)
-    if data_type == UKCPLocalProjections:
-        assert crop.dims["time"] == 365
-        assert (
-            CPM_FIRST_DATES == crop.time.dt.strftime(CLI_DATE_FORMAT_STR).head().values
-        ).all()
-    plot_xarray(
-        crop.tasmax[0],
-        path=crop_path / region / f"config-{config}.png",
-        time_stamp=True,
-    )
+    with open_dataset(paths[0]) as crop:
+        # assert crop.sizes[FINAL_RESAMPLE_LON_COL] == FINAL_CONVERTED_CPM_WIDTH
+        # assert_allclose(export.tasmax[10][5][:10].values, FINAL_CPM_DEC_10_5_X_0_10_Y)
+        if data_type == UKCPLocalProjections:
+            assert crop.sizes["time"] == 365
+            assert np.array_equal(CPM_FIRST_DATES, first_days(crop.time))
+        if plots_enabled:
+            plot_xarray(
+                crop.tasmax[0],
+                path=crop_path / region / f"config-{config}.png",
+                time_stamp=True,
+                stride=TEST_PLOT_STRIDE,
+            )
 
 
 def test_leap_year_days() -> None:
@@ -655,5 +681,102 @@ def test_time_gaps_360_to_standard_calendar(
 
         # Optionally now check which dates have been dropped and added
         # Add more assertions here...
-        assert all(base.time == dates_converted.time)
+        assert base.time.equals(dates_converted.time)
         assert all(base.time != dates_360.time)
+
+
+@pytest.mark.parametrize("limit", (1, 2, None))
+def test_interpolate_xr_ts_nans_vectorized_linear(
+    xarray_spatial_4_years: T_DataArray, limit: int | None
+) -> None:
+    """Test `vectorized_linear` matches `linear` `interpolate_na` results."""
+    base: T_Dataset = xarray_spatial_4_years.to_dataset()
+    # Gaps of 3 and 1 days each month, none at either end
+    with_gaps: T_Dataset = base.where(~base.time.dt.day.isin((3, 4, 5, 17)))
+    expected: T_Dataset = with_gaps.interpolate_na(
+        dim="time", method="linear", limit=limit, fill_value="extrapolate"
+    )
+    vectorized: T_Dataset = interpolate_xr_ts_nans(
+        with_gaps,
+        interpolate_method="linear",
+        limit=limit,
+        fast_limit_1=False,
+        vectorized_linear=True,
+    )
+    assert_allclose(vectorized.xa_template, expected.xa_template)
+
+
+@pytest.mark.parametrize("interpolate_method", ("linear", "nearest"))
+@pytest.mark.parametrize("uneven", (False, True))
+def test_interpolate_xr_ts_nans_fast_limit_1(
+    xarray_spatial_4_years: T_DataArray, interpolate_method: str, uneven: bool
+) -> None:
+    """Test `fast_limit_1` matches `interpolate_na` for isolated gaps."""
+    base: T_Dataset = xarray_spatial_4_years.to_dataset()
+    if uneven:
+        # Drop days so `time` steps vary between 1 and 3 days
+        base = base.where(~base.time.dt.day.isin((8, 9, 24)), drop=True)
+    with_gaps: T_Dataset = base.where(~base.time.dt.day.isin((3, 17)))
+    expected: T_Dataset = with_gaps.interpolate_na(
+        dim="time", method=interpolate_method, limit=1, fill_value="extrapolate"
+    )
+    fast: T_Dataset = interpolate_xr_ts_nans(
+        with_gaps, interpolate_method=interpolate_method, limit=1, fast_limit_1=True
+    )
+    assert_allclose(fast.xa_template, expected.xa_template)
+
+
+@pytest.mark.parametrize("interpolate_method", ("linear", "nearest"))
+@pytest.mark.parametrize("case", ("single_valid", "max_gap"))
+def test_interpolate_xr_ts_nans_fast_limit_1_fallback(
+    xarray_spatial_4_years: T_DataArray, interpolate_method: str, case: str
+) -> None:
+    """Test `fast_limit_1` cases `interpolate_na` handles differently."""
+    kwargs: dict = {}
+    if case == "single_valid":
+        # `interpolate_na` needs at least 2 valid values to fill a cell
+        with_gaps: T_Dataset = (
+            xarray_spatial_4_years.isel(time=slice(3)).to_dataset().copy(deep=True)
+        )
+        with_gaps.xa_template[0, 0] = np.nan
+        with_gaps.xa_template[2, 0] = np.nan
+    else:
+        base: T_Dataset = xarray_spatial_4_years.to_dataset()
+        with_gaps = base.where(~base.time.dt.day.isin((3, 17)))
+        # Single `nan` gaps span 2 days, so none are filled
+        kwargs["max_gap"] = np.timedelta64(1, "D")
+    expected: T_Dataset = with_gaps.interpolate_na(
+        dim="time",
+        method=interpolate_method,
+        limit=1,
+        fill_value="extrapolate",
+        **kwargs,
+    )
+    fast: T_Dataset = interpolate_xr_ts_nans(
+        with_gaps,
+        interpolate_method=interpolate_method,
+        limit=1,
+        fast_limit_1=True,
+        **kwargs,
+    )
+    assert_allclose(fast.xa_template, expected.xa_template)
+
+
+def test_apply_geo_func_to_zarr(xarray_spatial_4_years: T_DataArray, tmp_path: Path):
+    """Test `apply_geo_func` `to_zarr` round trip and `zstd` compression."""
+    pytest.importorskip("zarr")
+    source: T_Dataset = xarray_spatial_4_years.to_dataset()
+    source_path: Path = tmp_path / "source" / "xa_template.nc"
+    source_path.parent.mkdir()
+    source.to_netcdf(source_path)
+    zarr_path: Path = apply_geo_func(
+        source_path,
+        func=open_dataset,
+        export_folder=tmp_path / "export",
+        to_netcdf=False,
+        to_zarr=True,
+    )
+    assert zarr_path.suffix == f".{ZARR_EXTENSION_STR}"
+    with open_zarr(zarr_path) as exported:
+        assert exported.xa_template.encoding["compressor"].cname == ZARR_BLOSC_CNAME
+        assert_allclose(exported.xa_template, source.xa_template)
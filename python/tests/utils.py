@@ -3,15 +3,16 @@ from collections import UserDict
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from logging import getLogger
-from os import PathLike
+from os import PathLike, cpu_count
 from pathlib import Path
 from typing import Any, Awaitable, Callable, Final, Iterable, Sequence, TypedDict
 
+import pytest
 import sysrsync
-from numpy import array, nan, random
+from numpy import arange, array, nan, random
 from numpy.typing import NDArray
-from pandas import to_datetime
-from xarray import DataArray
+from pandas import DatetimeIndex, date_range, to_datetime
+from xarray import DataArray, Dataset, decode_cf
 from xarray.core.types import T_DataArray, T_DataArrayOrSet
 
 from clim_recal.resample import RAW_CPM_PATH, RAW_CPM_TASMAX_PATH, RAW_HADS_TASMAX_PATH
@@ -33,6 +34,16 @@ logger = getLogger(__name__)
 
 FINAL_CONVERTED_HADS_WIDTH: Final[int] = 410
 FINAL_CONVERTED_HADS_HEIGHT: Final[int] = 660
+# Relative tolerance for `float32` results, a few `float32` epsilons
+FLOAT32_RTOL: Final[float] = 1e-6
+# Plot every 4th spatial point, test plots are only for visual checks
+TEST_PLOT_STRIDE: Final[int] = 4
+# `multiprocess` startup costs outweigh gains on smaller runners
+MULTIPROCESS_MIN_CPUS: Final[int] = 4
+skip_small_runner_multiprocess = pytest.mark.skipif(
+    (cpu_count() or 1) < MULTIPROCESS_MIN_CPUS,
+    reason=f"`multiprocess` needs at least {MULTIPROCESS_MIN_CPUS} cpus",
+)
 
 FINAL_CPM_DEC_10_X_2_Y_200_210: Final[NDArray] = array(
     (
@@ -46,8 +57,15 @@ FINAL_CPM_DEC_10_X_2_Y_200_210: Final[NDArray] = array(
         9.640039,
         9.6349125,
         9.509668,
-    )
+    ),
+    dtype="float32",
+)
+FINAL_CPM_DEC_10_X_2_Y_200_210.setflags(write=False)
+# First 5 days of the CPM 1980 example after standard calendar conversion
+CPM_FIRST_DATES: Final[NDArray] = arange(
+    "1980-12-01", "1980-12-06", dtype="datetime64[D]"
 )
+CPM_FIRST_DATES.setflags(write=False)
 
 HADS_UK_TASMAX_DAY_SERVER_PATH: Final[Path] = Path("Raw/HadsUKgrid/tasmax/day")
 
@@ -182,6 +200,7 @@ def xarray_example(
     random_seed_int: int | None = XARRAY_EXAMPLE_RANDOM_SEED,
     name: str | None = None,
     as_dataset: bool = False,
+    use_date_range_generator: bool = False,
     **kwargs,
 ) -> T_DataArrayOrSet:
     """Generate spatial and temporal `xarray` objects.
@@ -202,6 +221,10 @@ def xarray_example(
         Convert output to `Dataset`.
     name
         Name of returned `DataArray` and `Dataset`.
+    use_date_range_generator
+        Whether to generate dates via `date_range_generator`
+        rather than `pandas.date_range`. Also used if any
+        `kwargs` other than `inclusive` are passed.
     kwargs
         Additional parameters to pass to `date_range_generator`.
 
@@ -225,21 +248,35 @@ def xarray_example(
       * time     (time) datetime64[ns] ...1980-11-30 ... 1980-12-04
       * space    (space) <U10 ...'Glasgow' 'Manchester' 'London'
     """
-    date_range: list[DateType] = list(
-        date_range_generator(
-            start_date=start_date,
-            end_date=end_date,
-            start_format_str=ISO_DATE_FORMAT_STR,
-            end_format_str=ISO_DATE_FORMAT_STR,
-            skip_dates=skip_dates,
-            **kwargs,
+    if use_date_range_generator or set(kwargs) - {"inclusive"}:
+        time_index: DatetimeIndex = to_datetime(
+            list(
+                date_range_generator(
+                    start_date=start_date,
+                    end_date=end_date,
+                    start_format_str=ISO_DATE_FORMAT_STR,
+                    end_format_str=ISO_DATE_FORMAT_STR,
+                    skip_dates=skip_dates,
+                    **kwargs,
+                )
+            )
         )
-    )
+    else:
+        time_index = date_range(
+            start_date,
+            end_date,
+            freq="D",
+            inclusive="both" if kwargs.get("inclusive") else "left",
+        )
+        if skip_dates:
+            if isinstance(skip_dates, str | date):
+                skip_dates = (skip_dates,)
+            time_index = time_index[~time_index.isin(to_datetime(list(skip_dates)))]
     if not name:
         name = f"xa_template"
     if isinstance(random_seed_int, int):
         random.seed(random_seed_int)  # ensure results are predictable
-    random_data: array = random.rand(len(date_range), len(coordinates))
+    random_data: array = random.rand(len(time_index), len(coordinates))
     spaces: list[str] = list(coordinates.keys())
     # If useful, add lat/lon (currently not working)
     # lat: list[float] = [coord[0] for coord in coordinates.values()]
@@ -248,7 +285,7 @@ def xarray_example(
         random_data,
         name=name,
         coords={
-            "time": to_datetime(date_range),
+            "time": time_index,
             "space": spaces,
             # "lon": lon,# *len(date_range),
             # "lat": lat,
@@ -260,6 +297,38 @@ def xarray_example(
         return da
 
 
+def first_days(time: T_DataArray, count: int = 5) -> NDArray:
+    """Return the first `count` `time` values as `datetime64[D]`.
+
+    `datetime64` values are cast directly; `cftime` objects are
+    composed from their integer `year`, `month` and `day` rather than
+    via `strftime`. If `time` was opened with `decode_times=False`,
+    only the first `count` values are decoded.
+
+    Examples
+    --------
+    >>> first_days(xarray_spatial_4_days.time, 2)
+    array(['1980-11-30', '1980-12-01'], dtype='datetime64[D]')
+    >>> first_days(xarray_spatial_4_days.convert_calendar(
+    ...     'standard', use_cftime=True).time, 2)
+    array(['1980-11-30', '1980-12-01'], dtype='datetime64[D]')
+    >>> undecoded: DataArray = DataArray(
+    ...     [0, 1, 2], dims='time', name='time',
+    ...     attrs={'units': 'days since 1980-12-01'})
+    >>> first_days(undecoded, 2)
+    array(['1980-12-01', '1980-12-02'], dtype='datetime64[D]')
+    """
+    if time.dtype.kind in "iuf" and "units" in time.attrs:
+        time = decode_cf(Dataset({time.name: time[:count].variable}))[time.name]
+    values: NDArray = time.values[:count]
+    if values.dtype.kind == "M":
+        return values.astype("datetime64[D]")
+    return array(
+        [f"{day.year:04}-{day.month:02}-{day.day:02}" for day in values],
+        dtype="datetime64[D]",
+    )
+
+
 CacheLogType = tuple[str, datetime | None, Path]
 SyncedLog = TypedDict("SyncedLog", {"time": datetime | None, "path": Path})
 